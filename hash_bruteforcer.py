@@ -2,26 +2,102 @@
 import sys
 import hashlib
 import itertools
+import functools
 import string
 import time
 import os
 import argparse
 import traceback
-import importlib.util
+import linecache
+import io
+import binascii
+import mmap
+import struct
+import multiprocessing
+import threading
+import platform
+import heapq
 import tempfile
-from concurrent.futures import ThreadPoolExecutor
-from PyQt5.QtWidgets import (QApplication, QMainWindow, QLabel, QComboBox, 
-                            QLineEdit, QPushButton, QTextEdit, QProgressBar, 
-                            QSpinBox, QCheckBox, QGridLayout, QWidget, QGroupBox,
-                            QTabWidget, QFileDialog, QHBoxLayout, QVBoxLayout,
-                            QMessageBox)
-from PyQt5.QtCore import QThread, pyqtSignal, Qt
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
 
 # Глобальная переменная для хранения пользовательской функции хеширования
 custom_hash_function = None
 
-# Получаем все доступные алгоритмы хеширования
-def get_available_hash_algorithms():
+# Пакетная пользовательская функция: список строк в байтах -> список хешей
+custom_hash_batch_function = None
+
+# Поштучная пользовательская функция, получающая байты (только для кода в форме модуля)
+custom_hash_bytes_function = None
+
+# Максимальное количество комбинаций, которые перебираются одной пачкой
+CANDIDATE_BATCH_SIZE = 10000
+
+# Минимальный интервал между обновлениями прогресса (в секундах)
+PROGRESS_INTERVAL = 0.1
+
+# При построчной обработке файлов часы опрашиваются раз в 1024 строки
+PROGRESS_CHECK_MASK = 0x3FF
+
+# Размер блока словаря в байтах, который читается и хешируется одной пачкой
+DICTIONARY_CHUNK_SIZE = 1 << 20
+
+# hashlib отпускает GIL при хешировании данных от 2048 байт
+THREAD_HASH_MIN_LENGTH = 2048
+
+# Перебор распределяется по процессам, начиная с этого количества комбинаций
+PARALLEL_MIN_COMBINATIONS = 1000000
+
+# Количество комбинаций в одном задании для процесса
+PARALLEL_CHUNK_SIZE = 500000
+
+# Словари начиная с этого размера в байтах проверяются в нескольких процессах
+PARALLEL_MIN_DICTIONARY_SIZE = 16 << 20
+
+# Размер участка словаря в байтах в одном задании для процесса
+PARALLEL_DICTIONARY_CHUNK_SIZE = 4 << 20
+
+# Пресеты наборов символов: флаг -> символы
+CHARSET_PRESETS = {
+    "a": string.ascii_lowercase,
+    "A": string.ascii_uppercase,
+    "0": string.digits,
+    "!": string.punctuation,
+}
+
+# Имя, под которым код пользовательской хеш-функции виден в трассировке
+CUSTOM_HASH_FILENAME = "<custom_hash>"
+
+# Суффикс файла отсортированного индекса радужной таблицы
+RAINBOW_INDEX_SUFFIX = ".idx"
+
+# Заголовок индекса: сигнатура, размер и время изменения таблицы
+RAINBOW_INDEX_MAGIC = b"HCRIDX01"
+_RAINBOW_INDEX_HEADER = struct.Struct("<8sQq")
+
+# Запись индекса: первые 16 байт хеша и смещение строки в таблице
+_RAINBOW_INDEX_RECORD = struct.Struct("<16sQ")
+RAINBOW_INDEX_KEY_SIZE = 16
+
+# Сколько записей индекса сортируется в памяти за раз; отсортированные серии
+# сохраняются во временные файлы и сливаются, так что память не растет с таблицей
+RAINBOW_INDEX_RUN_RECORDS = 1 << 19
+
+# Событие остановки в процессах перебора (задается при запуске процесса)
+_stop_event = None
+
+# Результаты JIT-компиляции пользовательских функций по исходному коду
+_custom_hash_jit_cache = {}
+
+# Строки для сверки скомпилированной функции с обычной. Целые в Numba 64-битные и
+# переполняются, а в Python нет, поэтому нужны и длинные строки: на коротких
+# накопительный хеш вроде h = h * 31 + ord(c) совпадает, на длинных - уже нет
+CUSTOM_HASH_JIT_SAMPLES = ("test", "", "a", "Password123!", "пароль",
+                           string.ascii_letters + string.digits,
+                           string.printable * 3, "~" * 256)
+
+# Проверяем, какие алгоритмы хеширования доступны в текущей системе.
+# Возвращает словарь: отображаемое имя -> конструктор хеш-объекта
+def _probe_hash_algorithms():
     # Стандартные алгоритмы
     standard_algorithms = [
         "MD5", "SHA1", "SHA224", "SHA256", "SHA384", "SHA512",
@@ -29,17 +105,17 @@ def get_available_hash_algorithms():
         "BLAKE2b", "BLAKE2s"
     ]
     
-    # Проверяем, какие из алгоритмов доступны в текущей системе
-    available = []
+    available = {}
     for algo in standard_algorithms:
         try:
             # Пытаемся создать объект хеширования с этим алгоритмом
             if algo.startswith("BLAKE2"):
                 # BLAKE2 требует указания длины дайджеста
-                getattr(hashlib, algo.lower())(digest_size=32)
+                ctor = functools.partial(getattr(hashlib, algo.lower()), digest_size=32)
             else:
-                getattr(hashlib, algo.lower())()
-            available.append(algo)
+                ctor = getattr(hashlib, algo.lower())
+            ctor()
+            available[algo] = ctor
         except (AttributeError, ValueError):
             # Этот алгоритм недоступен
             pass
@@ -54,11 +130,25 @@ def get_available_hash_algorithms():
                 h = hashlib.new(algo)
                 h.update(b"test")
                 h.hexdigest()
-                available.append(algo.upper())
+                if hasattr(hashlib, algo):
+                    available[upper_algo] = getattr(hashlib, algo)
+                else:
+                    available[upper_algo] = functools.partial(hashlib.new, algo)
             except (TypeError, ValueError):
                 # Некоторые алгоритмы могут быть недоступны или не поддерживать hexdigest
                 pass
     
+    return available
+
+# Доступные алгоритмы определяются один раз при загрузке модуля.
+# _HASH_CTORS: имя алгоритма в нижнем регистре -> конструктор хеш-объекта
+_HASH_ALGORITHMS = _probe_hash_algorithms()
+_HASH_CTORS = {name.lower(): ctor for name, ctor in _HASH_ALGORITHMS.items()}
+
+# Получаем все доступные алгоритмы хеширования
+def get_available_hash_algorithms():
+    available = list(_HASH_ALGORITHMS)
+    
     # Добавляем пользовательский хеш если он доступен
     if custom_hash_function is not None:
         available.append("CUSTOM")
@@ -73,35 +163,16 @@ def get_hash(text, hash_type):
         
         # Проверяем, если это пользовательский хеш
         if algo == "custom" and custom_hash_function is not None:
-            try:
-                result = custom_hash_function(text)
-                # Убедимся, что результат представляет собой строку
-                if not isinstance(result, str):
-                    result = str(result)
-                return result
-            except Exception as e:
-                print(f"Ошибка в пользовательской хеш-функции: {str(e)}")
-                return hashlib.md5(text.encode()).hexdigest()
+            return hash_custom_text(text)
         
-        # Обработка особых случаев
-        if algo.startswith("blake2"):
-            # BLAKE2 требует указания размера дайджеста
-            h = getattr(hashlib, algo)(digest_size=32)
-            h.update(text.encode())
-            return h.hexdigest()
+        ctor = _HASH_CTORS.get(algo)
+        if ctor is not None:
+            return ctor(text.encode()).hexdigest()
         elif "shake" in algo:
             # SHAKE требует указания длины вывода
             h = getattr(hashlib, algo)()
             h.update(text.encode())
             return h.hexdigest(128)  # Используем длину 128 байт
-        elif algo in hashlib.algorithms_available:
-            # Стандартные алгоритмы
-            if hasattr(hashlib, algo):
-                h = getattr(hashlib, algo)()
-            else:
-                h = hashlib.new(algo)
-            h.update(text.encode())
-            return h.hexdigest()
         else:
             # Если алгоритм не распознан, используем MD5
             return hashlib.md5(text.encode()).hexdigest()
@@ -109,754 +180,883 @@ def get_hash(text, hash_type):
         # В случае ошибки используем MD5
         return hashlib.md5(text.encode()).hexdigest()
 
-# Функция для проверки и загрузки пользовательской хеш-функции
-def load_custom_hash_function(code):
-    global custom_hash_function
-    
-    # Создаем временный файл для загрузки кода
-    with tempfile.NamedTemporaryFile(suffix='.py', delete=False, mode='w') as temp_file:
-        # Задаем шаблон функции, который ожидает строку и возвращает хеш
-        # Добавляем необходимые импорты
-        temp_file.write(f"""
-import hashlib
-import string
-import base64
-import binascii
-import math
-import zlib
+# Хешируем строку загруженной пользовательской функцией, результат всегда строка
+def hash_custom_text(text):
+    try:
+        result = custom_hash_function(text)
+        # Убедимся, что результат представляет собой строку
+        if not isinstance(result, str):
+            result = str(result)
+        return result
+    except Exception as e:
+        print(f"Ошибка в пользовательской хеш-функции: {str(e)}")
+        return hashlib.md5(text.encode()).hexdigest()
 
-def custom_hash(text):
-{code}
-""")
-        temp_path = temp_file.name
+# Пакетная версия поштучной пользовательской функции, получающей байты.
+# Ошибка на одном кандидате заменяется MD5, как в hash_custom_text
+def hash_custom_each(func, batch):
+    results = []
+    for data in batch:
+        try:
+            results.append(func(data))
+        except Exception as e:
+            print(f"Ошибка в пользовательской хеш-функции: {str(e)}")
+            results.append(hashlib.md5(data).hexdigest())
+    return results
+
+# Функция хеширования строки для выбранного алгоритма: ветвление get_hash
+# по типу хеша выполняется один раз, а не на каждой комбинации
+def get_text_hasher(hash_type):
+    if hash_type.lower() == "custom" and custom_hash_function is not None:
+        return hash_custom_text
+    return functools.partial(get_hash, hash_type=hash_type)
+
+# Получаем конструктор хеш-объекта для указанного алгоритма.
+# Возвращает None, если хеш нельзя посчитать через hashlib (CUSTOM, SHAKE)
+def get_hash_constructor(hash_type):
+    algo = hash_type.lower()
+    
+    if algo == "custom" or "shake" in algo:
+        return None
     
+    # Если алгоритм не распознан, используем MD5
+    return _HASH_CTORS.get(algo, hashlib.md5)
+
+# То же, что get_hash, но для данных в байтах и с сырым дайджестом вместо hex.
+# Возвращает None для CUSTOM и SHAKE, у которых нет дайджеста фиксированной длины
+def get_hash_bytes(data, hash_type):
+    ctor = get_hash_constructor(hash_type)
+    return ctor(data).digest() if ctor is not None else None
+
+# Получаем пустой хеш-объект для указанного алгоритма (None для CUSTOM и SHAKE).
+# Копирование готового объекта через copy() обходится дешевле, чем
+# инициализация нового контекста на каждую комбинацию
+def get_hash_template(hash_type):
+    ctor = get_hash_constructor(hash_type)
+    return ctor() if ctor is not None else None
+
+# Описание реализации, которая хеширует выбранным алгоритмом. Объекты OpenSSL
+# используют аппаратное ускорение (SHA-NI, AVX2), если его поддерживает процессор
+def describe_hash_backend(hash_type):
+    template = get_hash_template(hash_type)
+    if template is None:
+        return "пользовательская функция"
+    if type(template).__module__ == "_hashlib":
+        import ssl
+        return ssl.OPENSSL_VERSION
+    return f"встроенный модуль CPython {type(template).__module__}"
+
+# Собираем набор символов из пресетов (строка флагов CHARSET_PRESETS) и своих символов.
+# Повторы убираются за один проход с сохранением порядка: каждый повтор
+# увеличивал бы пространство перебора, не добавляя новых комбинаций
+def build_charset(presets, custom=""):
+    parts = [chars for flag, chars in CHARSET_PRESETS.items() if flag in presets]
+    parts.append(custom)
+    return ''.join(dict.fromkeys(''.join(parts)))
+
+# Число комбинаций длиной от min_length до max_length: сумма геометрической
+# прогрессии base**min_length + ... + base**max_length в замкнутом виде
+def count_combinations(base, min_length, max_length):
+    if max_length < min_length:
+        return 0
+    if base == 1:
+        return max_length - min_length + 1
+    return (base ** (max_length + 1) - base ** min_length) // (base - 1)
+
+# Переводим целевой хеш из hex-строки в байты (None, если это не hex)
+def parse_target_hash(target_hash):
     try:
-        # Загружаем модуль с пользовательской функцией
-        spec = importlib.util.spec_from_file_location("custom_hash_module", temp_path)
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
-        
-        # Проверяем работоспособность функции
-        test_result = module.custom_hash("test")
-        
-        # Сохраняем функцию глобально для использования
-        custom_hash_function = module.custom_hash
-        
-        # Удаляем временный файл
-        os.unlink(temp_path)
-        
-        return True, f"Функция успешно загружена. Тестовый хеш для 'test': {test_result}"
-    except Exception as e:
-        error_msg = f"Ошибка в коде хеш-функции: {str(e)}\n{traceback.format_exc()}"
-        # Удаляем временный файл
-        os.unlink(temp_path)
-        return False, error_msg
+        return bytes.fromhex(target_hash)
+    except ValueError:
+        return None
 
-class BruteForceWorker(QThread):
-    update_progress = pyqtSignal(int, str)
-    found_match = pyqtSignal(str, str)
-    finished_task = pyqtSignal()
-    
-    def __init__(self, hash_type, target_hash, char_set, min_length, max_length):
-        super().__init__()
-        self.hash_type = hash_type
-        self.target_hash = target_hash.lower()
-        self.char_set = char_set
-        self.min_length = min_length
-        self.max_length = max_length
-        self.running = True
-        
-    def stop(self):
-        self.running = False
-        
-    def run(self):
-        total_combinations = 0
-        for length in range(self.min_length, self.max_length + 1):
-            total_combinations += len(self.char_set) ** length
-            
-        tried_combinations = 0
-        found = False
-        
-        for length in range(self.min_length, self.max_length + 1):
-            if not self.running:
-                break
-                
-            for attempt in itertools.product(self.char_set, repeat=length):
-                if not self.running:
-                    break
-                    
-                tried_combinations += 1
-                if tried_combinations % 10000 == 0 or tried_combinations == total_combinations:
-                    progress = min(100, int((tried_combinations / total_combinations) * 100))
-                    current_text = ''.join(attempt)
-                    self.update_progress.emit(progress, current_text)
-                
-                text = ''.join(attempt)
-                hashed = get_hash(text, self.hash_type)
-                
-                if hashed == self.target_hash:
-                    self.found_match.emit(text, hashed)
-                    # Обеспечиваем достижение 100% прогресса при нахождении совпадения
-                    self.update_progress.emit(100, text)
-                    found = True
-                    break
-            
-            if found:
-                break
-        
-        # Устанавливаем прогресс в 100% при завершении, если не был найден результат
-        if not found and self.running:
-            self.update_progress.emit(100, "")
-                
-        self.finished_task.emit()
-    
-    def get_hash(self, text):
-        return get_hash(text, self.hash_type)
-
-class DictionaryBruteForceWorker(QThread):
-    update_progress = pyqtSignal(int, str)
-    found_match = pyqtSignal(str, str)
-    finished_task = pyqtSignal()
-    
-    def __init__(self, hash_type, target_hash, dictionary_path):
-        super().__init__()
-        self.hash_type = hash_type
-        self.target_hash = target_hash.lower()
-        self.dictionary_path = dictionary_path
-        self.running = True
-        
-    def stop(self):
-        self.running = False
-        
-    def run(self):
-        # Сначала посчитаем количество строк в файле для прогресса
-        total_lines = 0
-        with open(self.dictionary_path, 'r', encoding='utf-8', errors='ignore') as f:
-            for _ in f:
-                total_lines += 1
-                
-        tried_combinations = 0
-        found = False
-        
-        with open(self.dictionary_path, 'r', encoding='utf-8', errors='ignore') as f:
-            for line in f:
-                if not self.running:
-                    break
-                    
-                tried_combinations += 1
-                if tried_combinations % 1000 == 0 or tried_combinations == total_lines:
-                    progress = min(100, int((tried_combinations / total_lines) * 100))
-                    self.update_progress.emit(progress, line.strip())
-                
-                text = line.strip()
-                if not text:  # Пропускаем пустые строки
-                    continue
-                    
-                hashed = get_hash(text, self.hash_type)
-                
-                if hashed == self.target_hash:
-                    self.found_match.emit(text, hashed)
-                    # Обеспечиваем достижение 100% прогресса при нахождении совпадения
-                    self.update_progress.emit(100, text)
-                    found = True
-                    break
-        
-        # Устанавливаем прогресс в 100% при завершении, если не был найден результат
-        if not found and self.running:
-            self.update_progress.emit(100, "")
-                    
-        self.finished_task.emit()
+# Проверяем целевой хеш до запуска: hex-строка длиной в размер дайджеста алгоритма.
+# Возвращает текст ошибки или None. Формат результата CUSTOM неизвестен, его не проверяем
+def validate_target_hash(target_hash, hash_type):
+    if hash_type.lower() == "custom":
+        return None
+    
+    # Символы проверяем отдельно от длины: bytes.fromhex отвергает и нечетную
+    # длину, и тогда ошибка указывала бы не на ту причину
+    if not all(c in string.hexdigits for c in target_hash):
+        return "Ошибка: целевой хеш должен состоять из шестнадцатеричных символов"
+    
+    # У SHAKE длина вывода задается при хешировании, но это целое число байт
+    template = get_hash_template(hash_type)
+    if template is None:
+        if len(target_hash) % 2:
+            return (f"Ошибка: хеш {hash_type} содержит четное число шестнадцатеричных символов, "
+                    f"а введено {len(target_hash)}")
+        return None
+    
+    expected = template.digest_size * 2
+    if len(target_hash) != expected:
+        return (f"Ошибка: хеш {hash_type} содержит {expected} шестнадцатеричных символов, "
+                f"а введено {len(target_hash)}")
+    return None
+
+# Генератор комбинаций для перебора пачками.
+# Комбинации нумеруются в том же порядке, что и в itertools.product: номер
+# раскладывается по основанию len(charset). Пачка - это общий префикс и список
+# хвостов из заранее построенной таблицы: номер раскладывается только для первого
+# префикса, дальше префикс увеличивается как счетчик, а захешировать его
+# достаточно один раз на всю пачку.
+def iter_candidate_groups(charset, length, start=0, stop=None):
+    base = len(charset)
+    if base == 0:
+        return
+    empty = charset[0][:0]
+    
+    # Подбираем длину хвоста так, чтобы пачка не превышала CANDIDATE_BATCH_SIZE
+    tail_length = 0
+    span = 1
+    while tail_length < length and span * base <= CANDIDATE_BATCH_SIZE:
+        tail_length += 1
+        span *= base
+    
+    tails = [empty.join(p) for p in itertools.product(charset, repeat=tail_length)]
+    head_length = length - tail_length
     
-    def get_hash(self, text):
-        return get_hash(text, self.hash_type)
+    if stop is None:
+        stop = base ** length
+    
+    # Раскладываем номер первого префикса по основанию base
+    head_index, offset = divmod(start, span)
+    digits = [0] * head_length
+    for position in range(head_length - 1, -1, -1):
+        head_index, digits[position] = divmod(head_index, base)
+    head_chars = [charset[digit] for digit in digits]
+    
+    while start < stop:
+        end = min(span, offset + stop - start)
+        yield empty.join(head_chars), tails[offset:end]
+        
+        start += end - offset
+        offset = 0
+        
+        # Следующий префикс: прибавляем единицу к младшему разряду с переносом
+        position = head_length - 1
+        while position >= 0:
+            digit = digits[position] + 1
+            if digit < base:
+                digits[position] = digit
+                head_chars[position] = charset[digit]
+                break
+            digits[position] = 0
+            head_chars[position] = charset[0]
+            position -= 1
 
-class RainbowTableWorker(QThread):
-    update_progress = pyqtSignal(int, str)
-    found_match = pyqtSignal(str, str)
-    finished_task = pyqtSignal()
+# Отображаем открытый файл в память только для чтения.
+# Пустой файл отобразить нельзя, вместо него возвращается пустой буфер
+def map_file(f):
+    if os.fstat(f.fileno()).st_size == 0:
+        return io.BytesIO()
+    return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+# Читаем строки отображенного файла блоками, выровненными по концу строки.
+# Разбиение целого блока быстрее построчного чтения; пустые строки отбрасываются.
+# min_length/max_length - необязательные границы длины строки в байтах: строки вне
+# их отбрасываются до хеширования. Возвращает пачки строк без перевода строки и
+# позицию конца блока
+def iter_line_batches(buf, start, stop, min_length=None, max_length=None):
+    filter_length = min_length is not None or max_length is not None
+    low = 1 if min_length is None else max(1, min_length)
+    high = sys.maxsize if max_length is None else max_length
     
-    def __init__(self, target_hash, rainbow_path):
-        super().__init__()
-        self.target_hash = target_hash.lower()
-        self.rainbow_path = rainbow_path
-        self.running = True
+    while start < stop:
+        end = buf.find(b'\n', min(start + DICTIONARY_CHUNK_SIZE, stop) - 1)
+        end = len(buf) if end < 0 else end + 1
         
-    def stop(self):
-        self.running = False
+        chunk = buf[start:end]
+        lines = chunk.split(b'\n')
+        if b'\r' in chunk:
+            lines = [line.rstrip(b'\r') for line in lines]
         
-    def run(self):
-        # Сначала посчитаем количество строк в файле для прогресса
-        total_lines = 0
-        with open(self.rainbow_path, 'r', encoding='utf-8', errors='ignore') as f:
-            for _ in f:
-                total_lines += 1
+        if filter_length:
+            batch = [line for line in lines if low <= len(line) <= high]
+        else:
+            batch = list(filter(None, lines))
+        if batch:
+            yield batch, end
+        start = end
+
+# Путь к индексу радужной таблицы
+def rainbow_index_path(path):
+    return path + RAINBOW_INDEX_SUFFIX
+
+# Заголовок индекса привязан к размеру и времени изменения таблицы,
+# поэтому после изменения файла индекс строится заново
+def _rainbow_index_header(path):
+    st = os.stat(path)
+    return _RAINBOW_INDEX_HEADER.pack(RAINBOW_INDEX_MAGIC, st.st_size, st.st_mtime_ns)
+
+def rainbow_index_is_fresh(path):
+    try:
+        with open(rainbow_index_path(path), 'rb') as f:
+            return f.read(_RAINBOW_INDEX_HEADER.size) == _rainbow_index_header(path)
+    except OSError:
+        return False
+
+# Разбиваем упакованные записи на отдельные объекты и сортируем их.
+# Записи сравниваются побайтно, поэтому сортировка упаковки сортирует по хешу
+def _sort_rainbow_index_records(buf):
+    data = bytes(buf)
+    size = _RAINBOW_INDEX_RECORD.size
+    return sorted(data[i:i + size] for i in range(0, len(data), size))
+
+# Читаем записи отсортированной серии из временного файла блоками
+def _iter_rainbow_index_run(run):
+    size = _RAINBOW_INDEX_RECORD.size
+    run.seek(0)
+    for block in iter(functools.partial(run.read, size * 4096), b''):
+        for i in range(0, len(block), size):
+            yield block[i:i + size]
+
+# Строим отсортированный индекс (префикс хеша, смещение строки) и сохраняем его рядом с таблицей.
+# Записи копятся в компактном буфере и сортируются сериями по RAINBOW_INDEX_RUN_RECORDS,
+# серии сливаются при записи индекса.
+# progress(процент, строка) вызывается периодически; если она вернет False, построение прерывается
+def build_rainbow_index(path, progress=None):
+    header = _rainbow_index_header(path)
+    total_bytes = os.path.getsize(path)
+    pack = _RAINBOW_INDEX_RECORD.pack
+    run_bytes = RAINBOW_INDEX_RUN_RECORDS * _RAINBOW_INDEX_RECORD.size
+    unhexlify = binascii.unhexlify
+    index_path = rainbow_index_path(path)
+    tmp_path = index_path + ".tmp"
+    index_dir = os.path.dirname(os.path.abspath(index_path))
+    buf = bytearray()
+    runs = []
+    offset = 0
+    next_emit = time.monotonic() + PROGRESS_INTERVAL
+    
+    try:
+        with open(path, 'rb') as f, map_file(f) as mm:
+            for line_number, line in enumerate(iter(mm.readline, b'')):
+                line_offset = offset
+                offset += len(line)
                 
-        tried_combinations = 0
-        found = False
-        
-        with open(self.rainbow_path, 'r', encoding='utf-8', errors='ignore') as f:
-            for line in f:
-                if not self.running:
-                    break
-                    
-                tried_combinations += 1
-                if tried_combinations % 1000 == 0 or tried_combinations == total_lines:
-                    progress = min(100, int((tried_combinations / total_lines) * 100))
-                    self.update_progress.emit(progress, line.strip())
+                if progress is not None and not line_number & PROGRESS_CHECK_MASK:
+                    now = time.monotonic()
+                    if now >= next_emit:
+                        if progress(offset * 100 // total_bytes, line.strip().decode('utf-8', 'ignore')) is False:
+                            return False
+                        next_emit = now + PROGRESS_INTERVAL
                 
-                line = line.strip()
-                if not line:  # Пропускаем пустые строки
+                # Строки без hex-хеша в индекс не попадают
+                stored_hash = line.split(b':', 1)[0] if b':' in line else None
+                if stored_hash is None:
                     continue
-                
-                # Ожидаем формат файла: хеш:текст
-                if ':' not in line:
+                try:
+                    buf += pack(unhexlify(stored_hash.strip()), line_offset)
+                except ValueError:
                     continue
-                    
-                stored_hash, plaintext = line.split(':', 1)
-                stored_hash = stored_hash.lower()
                 
-                if stored_hash == self.target_hash:
-                    self.found_match.emit(plaintext, stored_hash)
-                    # Обеспечиваем достижение 100% прогресса при нахождении совпадения
-                    self.update_progress.emit(100, plaintext)
-                    found = True
-                    break
-        
-        # Устанавливаем прогресс в 100% при завершении, если не был найден результат
-        if not found and self.running:
-            self.update_progress.emit(100, "")
-                    
-        self.finished_task.emit()
-
-class HashBruteForcer(QMainWindow):
-    def __init__(self):
-        super().__init__()
-        self.initUI()
-        self.worker = None
-        
-    def initUI(self):
-        self.setWindowTitle('Хеш Брутфорсер')
-        self.resize(700, 600)
-        
-        # Main widget and layout
-        main_widget = QWidget()
-        self.setCentralWidget(main_widget)
-        grid = QGridLayout(main_widget)
-        
-        # Создаем вкладки
-        self.tabs = QTabWidget()
-        
-        # Вкладка для брутфорса перебором
-        self.bruteforce_tab = QWidget()
-        self.setup_bruteforce_tab()
-        self.tabs.addTab(self.bruteforce_tab, "Перебор")
-        
-        # Вкладка для брутфорса по словарю
-        self.dictionary_tab = QWidget()
-        self.setup_dictionary_tab()
-        self.tabs.addTab(self.dictionary_tab, "Словарь")
-        
-        # Вкладка для радужных таблиц
-        self.rainbow_tab = QWidget()
-        self.setup_rainbow_tab()
-        self.tabs.addTab(self.rainbow_tab, "Радужные таблицы")
-        
-        # Вкладка для своего метода хеширования
-        self.custom_hash_tab = QWidget()
-        self.setup_custom_hash_tab()
-        self.tabs.addTab(self.custom_hash_tab, "Свой хеш")
-        
-        # Hash settings group (общий для всех вкладок)
-        hash_group = QGroupBox("Настройки хеша")
-        hash_layout = QGridLayout()
-        hash_group.setLayout(hash_layout)
-        
-        # Hash type
-        hash_layout.addWidget(QLabel("Тип хеша:"), 0, 0)
-        self.hash_type = QComboBox()
-        # Получаем все доступные алгоритмы хеширования
-        self.hash_type.addItems(get_available_hash_algorithms())
-        hash_layout.addWidget(self.hash_type, 0, 1)
-        
-        # Target hash
-        hash_layout.addWidget(QLabel("Целевой хеш:"), 1, 0)
-        self.target_hash = QLineEdit()
-        hash_layout.addWidget(self.target_hash, 1, 1)
-        
-        # Control buttons
-        control_group = QGroupBox("Управление")
-        control_layout = QGridLayout()
-        control_group.setLayout(control_layout)
-        
-        self.start_button = QPushButton("Начать")
-        self.start_button.clicked.connect(self.start_bruteforce)
-        control_layout.addWidget(self.start_button, 0, 0)
-        
-        self.stop_button = QPushButton("Остановить")
-        self.stop_button.clicked.connect(self.stop_bruteforce)
-        self.stop_button.setEnabled(False)
-        control_layout.addWidget(self.stop_button, 0, 1)
-        
-        # Progress
-        progress_group = QGroupBox("Прогресс")
-        progress_layout = QGridLayout()
-        progress_group.setLayout(progress_layout)
-        
-        self.progress_bar = QProgressBar()
-        progress_layout.addWidget(self.progress_bar, 0, 0, 1, 2)
-        
-        progress_layout.addWidget(QLabel("Текущая комбинация:"), 1, 0)
-        self.current_attempt = QLineEdit()
-        self.current_attempt.setReadOnly(True)
-        progress_layout.addWidget(self.current_attempt, 1, 1)
-        
-        # Results
-        results_group = QGroupBox("Результаты")
-        results_layout = QGridLayout()
-        results_group.setLayout(results_layout)
-        
-        self.results = QTextEdit()
-        self.results.setReadOnly(True)
-        results_layout.addWidget(self.results, 0, 0)
-        
-        # Add all groups to main layout
-        grid.addWidget(self.tabs, 0, 0, 1, 2)
-        grid.addWidget(hash_group, 1, 0, 1, 2)
-        grid.addWidget(control_group, 2, 0, 1, 2)
-        grid.addWidget(progress_group, 3, 0, 1, 2)
-        grid.addWidget(results_group, 4, 0, 1, 2)
-    
-    def setup_bruteforce_tab(self):
-        layout = QGridLayout(self.bruteforce_tab)
-        
-        # Character set group
-        charset_group = QGroupBox("Набор символов")
-        charset_layout = QGridLayout()
-        charset_group.setLayout(charset_layout)
-        
-        # Character set options
-        self.use_lowercase = QCheckBox("Строчные буквы (a-z)")
-        self.use_lowercase.setChecked(True)
-        charset_layout.addWidget(self.use_lowercase, 0, 0)
-        
-        self.use_uppercase = QCheckBox("Заглавные буквы (A-Z)")
-        charset_layout.addWidget(self.use_uppercase, 1, 0)
-        
-        self.use_digits = QCheckBox("Цифры (0-9)")
-        self.use_digits.setChecked(True)
-        charset_layout.addWidget(self.use_digits, 2, 0)
-        
-        self.use_special = QCheckBox("Специальные символы")
-        charset_layout.addWidget(self.use_special, 3, 0)
-        
-        self.custom_charset = QLineEdit()
-        self.custom_charset.setPlaceholderText("Свой набор символов (опционально)")
-        charset_layout.addWidget(self.custom_charset, 4, 0, 1, 2)
-        
-        # Length settings
-        length_group = QGroupBox("Длина строки")
-        length_layout = QGridLayout()
-        length_group.setLayout(length_layout)
-        
-        length_layout.addWidget(QLabel("Минимальная длина:"), 0, 0)
-        self.min_length = QSpinBox()
-        self.min_length.setMinimum(1)
-        self.min_length.setMaximum(10)
-        self.min_length.setValue(1)
-        length_layout.addWidget(self.min_length, 0, 1)
-        
-        length_layout.addWidget(QLabel("Максимальная длина:"), 1, 0)
-        self.max_length = QSpinBox()
-        self.max_length.setMinimum(1)
-        self.max_length.setMaximum(10)
-        self.max_length.setValue(4)
-        length_layout.addWidget(self.max_length, 1, 1)
-        
-        layout.addWidget(charset_group, 0, 0)
-        layout.addWidget(length_group, 1, 0)
-        
-    def setup_dictionary_tab(self):
-        layout = QGridLayout(self.dictionary_tab)
-        
-        # Dictionary file selection
-        dict_group = QGroupBox("Файл словаря")
-        dict_layout = QGridLayout()
-        dict_group.setLayout(dict_layout)
-        
-        dict_layout.addWidget(QLabel("Путь к файлу:"), 0, 0)
-        
-        # File selection layout
-        file_layout = QHBoxLayout()
-        
-        self.dict_path = QLineEdit()
-        self.dict_path.setReadOnly(True)
-        self.dict_path.setPlaceholderText("Выберите файл словаря...")
-        file_layout.addWidget(self.dict_path)
-        
-        self.browse_button = QPushButton("Обзор...")
-        self.browse_button.clicked.connect(self.browse_dictionary)
-        file_layout.addWidget(self.browse_button)
+                # Буфер заполнен: сортируем серию и выгружаем ее во временный файл
+                if len(buf) >= run_bytes:
+                    run = tempfile.TemporaryFile(dir=index_dir)
+                    runs.append(run)
+                    run.write(b''.join(_sort_rainbow_index_records(buf)))
+                    buf = bytearray()
         
-        dict_layout.addLayout(file_layout, 0, 1)
+        records = _sort_rainbow_index_records(buf)
+        del buf
         
-        # Dictionary options
-        self.dict_options_group = QGroupBox("Настройки словаря")
-        dict_options_layout = QGridLayout()
-        self.dict_options_group.setLayout(dict_options_layout)
-        
-        self.use_dict_as_is = QCheckBox("Использовать слова как есть")
-        self.use_dict_as_is.setChecked(True)
-        dict_options_layout.addWidget(self.use_dict_as_is, 0, 0)
-        
-        # В будущем можно добавить дополнительные опции:
-        # - Добавление чисел до/после слова
-        # - Использование разных регистров
-        # - Замена букв на похожие символы
-        
-        layout.addWidget(dict_group, 0, 0)
-        layout.addWidget(self.dict_options_group, 1, 0)
-    
-    def setup_rainbow_tab(self):
-        layout = QGridLayout(self.rainbow_tab)
-        
-        # Rainbow table file selection
-        rainbow_group = QGroupBox("Файл радужной таблицы")
-        rainbow_layout = QGridLayout()
-        rainbow_group.setLayout(rainbow_layout)
-        
-        rainbow_layout.addWidget(QLabel("Путь к файлу:"), 0, 0)
-        
-        # File selection layout
-        file_layout = QHBoxLayout()
-        
-        self.rainbow_path = QLineEdit()
-        self.rainbow_path.setReadOnly(True)
-        self.rainbow_path.setPlaceholderText("Выберите файл радужной таблицы...")
-        file_layout.addWidget(self.rainbow_path)
-        
-        self.rainbow_browse_button = QPushButton("Обзор...")
-        self.rainbow_browse_button.clicked.connect(self.browse_rainbow)
-        file_layout.addWidget(self.rainbow_browse_button)
-        
-        rainbow_layout.addLayout(file_layout, 0, 1)
-        
-        # Информация о радужных таблицах
-        info_group = QGroupBox("Информация")
-        info_layout = QVBoxLayout()
-        info_group.setLayout(info_layout)
-        
-        info_text = QTextEdit()
-        info_text.setReadOnly(True)
-        info_text.setPlainText(
-            "Радужные таблицы - это метод взлома хешей, который использует предварительно вычисленные таблицы для нахождения "
-            "исходного текста по его хешу.\n\n"
-            "Формат файла радужной таблицы: хеш:исходный_текст (по одной паре на строку).\n\n"
-            "Пример:\n"
-            "5f4dcc3b5aa765d61d8327deb882cf99:password\n"
-            "827ccb0eea8a706c4c34a16891f84e7b:12345"
-        )
-        info_layout.addWidget(info_text)
-        
-        layout.addWidget(rainbow_group, 0, 0)
-        layout.addWidget(info_group, 1, 0)
-    
-    def setup_custom_hash_tab(self):
-        layout = QVBoxLayout(self.custom_hash_tab)
-        
-        # Группа для редактора кода хеш-функции
-        editor_group = QGroupBox("Редактор кода хеш-функции")
-        editor_layout = QVBoxLayout()
-        editor_group.setLayout(editor_layout)
-        
-        # Описание и инструкции
-        instructions = QLabel(
-            "Введите код для вашей хеш-функции. Функция должна принимать строку и возвращать хеш.\n"
-            "Код должен быть отступлен на 4 пробела, так как он будет вставлен в тело функции."
-        )
-        editor_layout.addWidget(instructions)
-        
-        # Пример кода
-        example_code = QTextEdit()
-        example_code.setReadOnly(True)
-        example_code.setPlainText(
-            "# Пример своей хеш-функции:\n\n"
-            "    # Простой хеш-алгоритм, суммирующий ASCII-коды символов\n"
-            "    total = 0\n"
-            "    for char in text:\n"
-            "        total += ord(char)\n"
-            "    return hex(total)[2:]  # Преобразуем в hex и убираем '0x'\n\n"
-            "# Для использования встроенных алгоритмов можно импортировать hashlib:\n\n"
-            "    import hashlib\n"
-            "    # Комбинированный хеш MD5 + SHA1\n"
-            "    md5 = hashlib.md5(text.encode()).hexdigest()\n"
-            "    sha1 = hashlib.sha1(text.encode()).hexdigest()\n"
-            "    return md5 + sha1[:10]  # MD5 + первые 10 символов SHA1"
-        )
-        editor_layout.addWidget(example_code)
-        
-        # Редактор кода
-        editor_layout.addWidget(QLabel("Ваш код хеш-функции:"))
-        self.hash_code_editor = QTextEdit()
-        self.hash_code_editor.setPlainText("    # Введите код вашей хеш-функции здесь\n    return hashlib.md5(text.encode()).hexdigest()")
-        editor_layout.addWidget(self.hash_code_editor)
-        
-        # Кнопка для загрузки функции
-        load_button = QPushButton("Загрузить хеш-функцию")
-        load_button.clicked.connect(self.load_custom_hash)
-        editor_layout.addWidget(load_button)
-        
-        # Статус загрузки
-        self.hash_status = QLabel("Статус: Не загружено")
-        editor_layout.addWidget(self.hash_status)
-        
-        layout.addWidget(editor_group)
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(header)
+                if runs:
+                    f.writelines(heapq.merge(records, *map(_iter_rainbow_index_run, runs)))
+                else:
+                    f.write(b''.join(records))
+            os.replace(tmp_path, index_path)
+        except BaseException:
+            # Недописанный индекс (например, при нехватке места) рядом с таблицей не оставляем
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+        return True
+    finally:
+        for run in runs:
+            run.close()
+
+# Ищем хеш в индексе двоичным поиском и сверяем полный хеш со строкой таблицы.
+# Возвращает текст в байтах или None
+def lookup_rainbow_index(path, target_bytes):
+    key = target_bytes[:RAINBOW_INDEX_KEY_SIZE].ljust(RAINBOW_INDEX_KEY_SIZE, b'\0')
+    record_size = _RAINBOW_INDEX_RECORD.size
+    start = _RAINBOW_INDEX_HEADER.size
     
-    def load_custom_hash(self):
-        code = self.hash_code_editor.toPlainText()
-        success, message = load_custom_hash_function(code)
-        
-        if success:
-            self.hash_status.setText(f"Статус: {message}")
-            # Обновляем список алгоритмов хеширования
-            current_algo = self.hash_type.currentText()
-            self.hash_type.clear()
-            self.hash_type.addItems(get_available_hash_algorithms())
-            
-            # Попытаемся выбрать "CUSTOM" в списке
-            custom_index = self.hash_type.findText("CUSTOM")
-            if custom_index >= 0:
-                self.hash_type.setCurrentIndex(custom_index)
+    with open(rainbow_index_path(path), 'rb') as idx_file, map_file(idx_file) as idx, \
+         open(path, 'rb') as f, map_file(f) as mm:
+        count = (len(idx) - start) // record_size
+        
+        lo, hi = 0, count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            pos = start + mid * record_size
+            if idx[pos:pos + RAINBOW_INDEX_KEY_SIZE] < key:
+                lo = mid + 1
             else:
-                # Если не нашли, пытаемся вернуть предыдущий выбор
-                prev_index = self.hash_type.findText(current_algo)
-                if prev_index >= 0:
-                    self.hash_type.setCurrentIndex(prev_index)
-        else:
-            self.hash_status.setText(f"Статус: Ошибка загрузки")
-            # Показываем сообщение об ошибке
-            QMessageBox.critical(self, "Ошибка загрузки хеш-функции", message)
-    
-    def start_bruteforce(self):
-        target_hash = self.target_hash.text().strip()
-        if not target_hash:
-            self.results.append("Ошибка: введите целевой хеш")
-            return
-        
-        hash_type = self.hash_type.currentText()
-        
-        # Очистка прогресса и результатов
-        self.progress_bar.setValue(0)
-        self.current_attempt.clear()
-        self.results.clear()
-        self.results.append(f"Начало брутфорса для хеша: {target_hash}")
-        self.results.append(f"Тип хеша: {hash_type}")
+                hi = mid
         
-        # Проверим какая вкладка активна
-        current_tab = self.tabs.currentIndex()
-        
-        if current_tab == 0:  # Вкладка "Перебор"
-            charset = self.get_charset()
-            if not charset:
-                self.results.append("Ошибка: выберите хотя бы один набор символов")
-                return
-                
-            min_length = self.min_length.value()
-            max_length = self.max_length.value()
-            
-            if min_length > max_length:
-                self.results.append("Ошибка: минимальная длина не может быть больше максимальной")
-                return
-                
-            self.results.append(f"Набор символов: {charset}")
-            self.results.append(f"Длина: {min_length}-{max_length}")
-            self.results.append("Выполнение...")
-            
-            self.worker = BruteForceWorker(hash_type, target_hash, charset, min_length, max_length)
-        
-        elif current_tab == 1:  # Вкладка "Словарь"
-            dict_path = self.dict_path.text()
-            if not dict_path or not os.path.isfile(dict_path):
-                self.results.append("Ошибка: выберите корректный файл словаря")
-                return
-            
-            self.results.append(f"Файл словаря: {dict_path}")
-            self.results.append("Выполнение...")
+        # Префикс может совпасть у нескольких записей, проверяем каждую
+        for i in range(lo, count):
+            stored_key, offset = _RAINBOW_INDEX_RECORD.unpack_from(idx, start + i * record_size)
+            if stored_key != key:
+                break
             
-            self.worker = DictionaryBruteForceWorker(hash_type, target_hash, dict_path)
+            end = mm.find(b'\n', offset)
+            if end < 0:
+                end = len(mm)
+            stored_hash, plaintext = mm[offset:end].strip().split(b':', 1)
+            if binascii.unhexlify(stored_hash.strip()) == target_bytes:
+                return plaintext
+    
+    return None
+
+# Инициализация процесса перебора: сохраняем общее событие остановки
+def _init_search_process(stop_event):
+    global _stop_event
+    _stop_event = stop_event
+
+# Перебор комбинаций с номерами [start, stop) в отдельном процессе.
+# Возвращает найденную комбинацию в байтах или None
+def _search_range(hash_type, target_bytes, charset_bytes, length, start, stop):
+    find_match, _ = make_batch_matcher(hash_type, target_bytes.hex())
+    
+    for head, tails in iter_candidate_groups(charset_bytes, length, start, stop):
+        # Другой процесс уже нашел совпадение или перебор остановлен
+        if _stop_event is not None and _stop_event.is_set():
+            return None
+        
+        candidate = find_match(head, tails)
+        if candidate is not None:
+            if _stop_event is not None:
+                _stop_event.set()
+            return candidate
+    
+    return None
+
+# Проверка строк словаря, начинающихся в байтах [start, stop), в отдельном процессе.
+# Строка, начатая в предыдущем участке, относится к нему и пропускается.
+# Возвращает найденную строку в байтах или None
+def _search_dictionary_range(hash_type, target_bytes, path, start, stop,
+                             min_length=None, max_length=None):
+    find_match = make_line_matcher(hash_type, target_bytes.hex())
+    
+    with open(path, 'rb') as f, map_file(f) as mm:
+        if start > 0 and mm[start - 1:start] != b'\n':
+            start = mm.find(b'\n', start) + 1
+            if start == 0:
+                return None
+        
+        for batch, _ in iter_line_batches(mm, start, stop, min_length, max_length):
+            # Другой процесс уже нашел совпадение или поиск остановлен
+            if _stop_event is not None and _stop_event.is_set():
+                return None
             
-        elif current_tab == 2:  # Вкладка "Радужные таблицы"
-            rainbow_path = self.rainbow_path.text()
-            if not rainbow_path or not os.path.isfile(rainbow_path):
-                self.results.append("Ошибка: выберите корректный файл радужной таблицы")
-                return
+            match = find_match(batch)
+            if match is not None:
+                if _stop_event is not None:
+                    _stop_event.set()
+                return match
+    
+    return None
+
+# Поиск по словарю в пуле процессов, участками по PARALLEL_DICTIONARY_CHUNK_SIZE байт.
+# progress(обработано байт, None); min_length/max_length - как в iter_line_batches
+def parallel_dictionary_search(hash_type, target_bytes, path, workers, progress=None,
+                               min_length=None, max_length=None):
+    total_bytes = os.path.getsize(path)
+    tasks = ((min(PARALLEL_DICTIONARY_CHUNK_SIZE, total_bytes - start),
+              (hash_type, target_bytes, path, start,
+               min(start + PARALLEL_DICTIONARY_CHUNK_SIZE, total_bytes), min_length, max_length))
+             for start in range(0, total_bytes, PARALLEL_DICTIONARY_CHUNK_SIZE))
+    
+    def report(done_bytes, args):
+        return progress(done_bytes, None)
+    
+    return run_search_pool(_search_dictionary_range, tasks, workers, report if progress else None)
+
+# Задания для пула процессов: диапазоны номеров комбинаций по PARALLEL_CHUNK_SIZE
+# для каждой длины, вместе с размером диапазона для подсчета прогресса
+def _iter_search_ranges(hash_type, target_bytes, charset_bytes, min_length, max_length):
+    base = len(charset_bytes)
+    for length in range(min_length, max_length + 1):
+        count = base ** length
+        for start in range(0, count, PARALLEL_CHUNK_SIZE):
+            stop = min(start + PARALLEL_CHUNK_SIZE, count)
+            yield stop - start, (hash_type, target_bytes, charset_bytes, length, start, stop)
+
+# Выполняем func(*args) для заданий (размер, args) в пуле процессов и возвращаем
+# первый результат, отличный от None. progress(выполнено, args последнего завершенного
+# задания или None) вызывается не чаще PROGRESS_INTERVAL; если она вернет False,
+# поиск прерывается
+def run_search_pool(func, tasks, workers, progress=None):
+    tasks = iter(tasks)
+    done_size = 0
+    last_args = None
+    found = None
+    next_emit = time.monotonic() + PROGRESS_INTERVAL
+    
+    # spawn вместо fork: форк процесса с запущенными потоками Qt небезопасен
+    context = multiprocessing.get_context("spawn")
+    stop_event = context.Event()
+    pool = ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                               initializer=_init_search_process,
+                               initargs=(stop_event,))
+    pending = {}
+    try:
+        while True:
+            # Держим в очереди не больше двух заданий на процесс
+            while len(pending) < workers * 2:
+                task = next(tasks, None)
+                if task is None:
+                    break
+                pending[pool.submit(func, *task[1])] = task
             
-            self.results.append(f"Файл радужной таблицы: {rainbow_path}")
-            self.results.append(f"Примечание: для радужных таблиц тип хеша должен соответствовать типу в таблице")
-            self.results.append("Выполнение...")
+            if not pending:
+                break
             
-            self.worker = RainbowTableWorker(target_hash, rainbow_path)
+            done, _ = wait(pending, timeout=PROGRESS_INTERVAL, return_when=FIRST_COMPLETED)
+            for future in done:
+                size, last_args = pending.pop(future)
+                done_size += size
+                result = future.result()
+                if result is not None:
+                    found = result
             
-        elif current_tab == 3:  # Вкладка "Свой хеш"
-            self.results.append("Ошибка: вкладка 'Свой хеш' используется только для создания хеш-функции")
-            self.results.append("Для выполнения брутфорса перейдите на вкладку 'Перебор', 'Словарь' или 'Радужные таблицы'")
-            return
-        else:
-            self.results.append("Ошибка: неизвестная вкладка")
-            return
+            if found is not None:
+                break
             
-        # Подключаем сигналы и запускаем
-        self.worker.update_progress.connect(self.update_progress)
-        self.worker.found_match.connect(self.found_match)
-        self.worker.finished_task.connect(self.finished_task)
-        
-        self.start_button.setEnabled(False)
-        self.stop_button.setEnabled(True)
-        
-        self.worker.start()
+            now = time.monotonic()
+            if progress is not None and now >= next_emit:
+                if progress(done_size, last_args) is False:
+                    break
+                next_emit = now + PROGRESS_INTERVAL
+    finally:
+        # Останавливаем оставшиеся процессы
+        stop_event.set()
+        for future in pending:
+            future.cancel()
+        pool.shutdown()
+    
+    return found
+
+# Перебор длин [min_length, max_length] в пуле процессов.
+# progress(перебрано, последняя проверенная комбинация в байтах или None)
+def parallel_bruteforce(hash_type, target_bytes, charset_bytes, min_length, max_length,
+                        workers, progress=None):
+    tasks = _iter_search_ranges(hash_type, target_bytes, charset_bytes, min_length, max_length)
+    
+    def report(tried, args):
+        last = None
+        if args is not None:
+            # Показываем последнюю комбинацию завершенного диапазона
+            length, stop = args[3], args[5]
+            head, tails = next(iter_candidate_groups(charset_bytes, length, stop - 1, stop))
+            last = head + tails[-1]
+        return progress(tried, last)
+    
+    return run_search_pool(_search_range, tasks, workers, report if progress else None)
+
+# Пытаемся скомпилировать пользовательскую функцию через Numba, если он установлен.
+# Numba справляется только с числовым кодом (ord, арифметика, циклы), поэтому при любой
+# ошибке или расхождении результата с обычной функцией хотя бы на одной из строк
+# samples возвращаем None
+def compile_custom_hash(func, source, samples=CUSTOM_HASH_JIT_SAMPLES):
+    if source in _custom_hash_jit_cache:
+        return _custom_hash_jit_cache[source]
+    
+    jitted = None
+    try:
+        import numba
         
-    def stop_bruteforce(self):
-        if self.worker:
-            self.worker.stop()
-            self.results.append("Остановлено пользователем")
+        # cache=True недоступен для кода без файла, поэтому кешируем в памяти
+        candidate = numba.njit(func)
+        if all(candidate(sample) == func(sample) for sample in samples):
+            jitted = candidate
+    except Exception:
+        jitted = None
+    
+    _custom_hash_jit_cache[source] = jitted
+    return jitted
+
+# Хешируем пачку кандидатов (в байтах) пакетной пользовательской функцией.
+# Возвращает совпавшего кандидата или None
+def find_custom_batch_match(batch, target_hash):
+    # Результат может быть ленивым итератором, поэтому собираем его в список
+    # внутри try: иначе функция выполнялась бы уже вне обработки ошибок
+    try:
+        results = list(custom_hash_batch_function(batch))
+        if len(results) != len(batch):
+            raise ValueError(f"custom_hash_batch вернула {len(results)} хешей для {len(batch)} строк")
+    except Exception as e:
+        print(f"Ошибка в пользовательской хеш-функции: {str(e)}")
+        # Проверяем пачку поштучно, как без пакетной функции. Функции в форме модуля
+        # получают те же байты: перекодирование через строку исказило бы не-UTF-8 строки
+        if custom_hash_bytes_function is not None:
+            results = hash_custom_each(custom_hash_bytes_function, batch)
+        else:
+            results = [hash_custom_text(candidate.decode('utf-8', 'ignore')) for candidate in batch]
+    
+    for candidate, result in zip(batch, results):
+        if not isinstance(result, str):
+            result = str(result)
+        if result == target_hash:
+            return candidate
+    return None
+
+# Выбираем способ проверки пачки кандидатов один раз, чтобы не ветвиться на каждом кандидате.
+# Возвращает функцию find_match(head, tails) -> совпавший кандидат или None и признак того,
+# что кандидаты собираются в байтах (пользовательской функции без пакетной версии нужны строки)
+def make_batch_matcher(hash_type, target_hash):
+    template = get_hash_template(hash_type)
+    if template is not None:
+        new_hash = template.copy
+        tgt = parse_target_hash(target_hash)
+        
+        def find_match(head, tails):
+            # Общий префикс хешируем один раз, для каждого кандидата копируем
+            # состояние и дописываем только хвост. Сравниваем сырые байты дайджеста
+            prefix = new_hash()
+            prefix.update(head)
+            copy = prefix.copy
+            for tail in tails:
+                h = copy()
+                h.update(tail)
+                if h.digest() == tgt:
+                    return head + tail
+            return None
+        return find_match, True
+    
+    if hash_type.lower() == "custom" and custom_hash_batch_function is not None:
+        # Пакетная пользовательская функция получает всю пачку сразу, в байтах
+        def find_match(head, tails):
+            return find_custom_batch_match([head + tail for tail in tails], target_hash)
+        return find_match, True
+    
+    hash_text = get_text_hasher(hash_type)
+    
+    def find_match(head, tails):
+        for tail in tails:
+            candidate = head + tail
+            if hash_text(candidate) == target_hash:
+                return candidate
+        return None
+    return find_match, False
+
+# То же для строк словаря, которые всегда читаются в байтах.
+# Возвращает функцию find_match(batch) -> совпавшая строка или None
+def make_line_matcher(hash_type, target_hash):
+    template = get_hash_template(hash_type)
+    if template is not None:
+        new_hash = template.copy
+        tgt = parse_target_hash(target_hash)
+        
+        def find_match(batch):
+            for line in batch:
+                h = new_hash()
+                h.update(line)
+                if h.digest() == tgt:
+                    return line
+            return None
+        return find_match
+    
+    if hash_type.lower() == "custom" and custom_hash_batch_function is not None:
+        return functools.partial(find_custom_batch_match, target_hash=target_hash)
+    
+    hash_text = get_text_hasher(hash_type)
+    
+    def find_match(batch):
+        # Пользовательская функция работает со строками
+        for line in batch:
+            if hash_text(line.decode('utf-8', 'ignore')) == target_hash:
+                return line
+        return None
+    return find_match
+
+# Просматриваем радужную таблицу целиком, строка за строкой. Нужен для хешей не в hex
+# и для таблиц без индекса. progress(процент, строка) вызывается периодически; если она
+# вернет False, просмотр прерывается. Возвращает текст в байтах или None
+def scan_rainbow_table(path, target_hash, progress=None):
+    # Если целевой хеш не hex (например, от CUSTOM), сравниваем строки
+    tgt = parse_target_hash(target_hash)
+    target_raw = target_hash.encode()
+    unhexlify = binascii.unhexlify
+    total_bytes = os.path.getsize(path)
+    next_emit = time.monotonic() + PROGRESS_INTERVAL
+    
+    with open(path, 'rb') as f, map_file(f) as mm:
+        for batch, position in iter_line_batches(mm, 0, total_bytes):
+            for line in batch:
+                # Ожидаем формат файла: хеш:текст
+                if b':' not in line:
+                    continue
+                
+                # Разбираем строку в байтах, декодируется только найденный текст
+                stored_hash, plaintext = line.strip().split(b':', 1)
+                
+                if tgt is not None:
+                    try:
+                        if unhexlify(stored_hash.strip()) != tgt:
+                            continue
+                    except ValueError:
+                        continue
+                elif stored_hash.lower() != target_raw:
+                    continue
+                
+                return plaintext
             
-    def update_progress(self, value, current_text):
-        self.progress_bar.setValue(value)
-        self.current_attempt.setText(current_text)
+            now = time.monotonic()
+            if progress is not None and now >= next_emit:
+                line = batch[-1].strip().decode('utf-8', 'ignore')
+                if progress(min(100, position * 100 // total_bytes), line) is False:
+                    return None
+                next_emit = now + PROGRESS_INTERVAL
+    
+    return None
+
+# Функция для проверки и загрузки пользовательской хеш-функции
+def load_custom_hash_function(code):
+    global custom_hash_function, custom_hash_batch_function, custom_hash_bytes_function
+    
+    # Если custom_hash объявлена в коде без отступа, код выполняется как модуль:
+    # функция получает байты, а необязательная custom_hash_batch - список строк в байтах
+    module_form = any(line.startswith("def custom_hash(") for line in code.splitlines())
+    
+    # Добавляем необходимые импорты
+    source = """
+import hashlib
+import string
+import base64
+import binascii
+import math
+import zlib
+
+"""
+    if module_form:
+        source += f"{code}\n"
+    else:
+        # Задаем шаблон функции, который ожидает строку и возвращает хеш
+        source += f"def custom_hash(text):\n{code}\n"
+    
+    # Регистрируем исходный код, чтобы трассировка ошибок показывала строки функции
+    linecache.cache[CUSTOM_HASH_FILENAME] = (len(source), None, source.splitlines(True),
+                                             CUSTOM_HASH_FILENAME)
+    
+    try:
+        # Компилируем и выполняем код в памяти, без временного файла
+        namespace = {}
+        exec(compile(source, CUSTOM_HASH_FILENAME, "exec"), namespace)
         
-    def found_match(self, text, hashed):
-        self.results.append(f"Найдено совпадение!")
-        self.results.append(f"Текст: {text}")
-        self.results.append(f"Хеш: {hashed}")
+        # Проверяем работоспособность функции
+        sample = b"test" if module_form else "test"
+        test_result = namespace["custom_hash"](sample)
+        
+        batch_func = namespace.get("custom_hash_batch") if module_form else None
+        if batch_func is not None:
+            list(batch_func([sample]))
+        
+        # Первый вызов скомпилированной функции может занять несколько секунд
+        samples = CUSTOM_HASH_JIT_SAMPLES
+        if module_form:
+            samples = [text.encode() for text in samples]
+        jitted = compile_custom_hash(namespace["custom_hash"], source, samples)
+        func = jitted or namespace["custom_hash"]
+        
+        # Сохраняем функции глобально для использования
+        if module_form:
+            custom_hash_function = lambda text: func(text.encode())
+            custom_hash_batch_function = batch_func or functools.partial(hash_custom_each, func)
+            custom_hash_bytes_function = func
+        else:
+            custom_hash_function = func
+            custom_hash_batch_function = None
+            custom_hash_bytes_function = None
+        
+        message = f"Функция успешно загружена. Тестовый хеш для 'test': {test_result}"
+        if jitted is not None:
+            message += "\nФункция скомпилирована через Numba."
+        if batch_func is not None:
+            message += "\nНайдена пакетная функция custom_hash_batch."
+        return True, message
+    except Exception as e:
+        error_msg = f"Ошибка в коде хеш-функции: {str(e)}\n{traceback.format_exc()}"
+        return False, error_msg
+
+# Вывод прогресса в командной строке из отдельного потока: цикл перебора только
+# обновляет done и last, а поток печатает их раз в PROGRESS_INTERVAL секунд
+class ProgressReporter(threading.Thread):
+    def __init__(self, total, label, to_text=str):
+        super().__init__(daemon=True)
+        self.total = total
+        self.label = label
+        self.to_text = to_text
+        self.done = 0
+        self.last = None
+        self._finished = threading.Event()
         
-    def finished_task(self):
-        # При завершении задачи убедимся, что прогресс-бар установлен на 100%
-        if self.progress_bar.value() < 100:
-            self.progress_bar.setValue(100)
+    def run(self):
+        while not self._finished.wait(PROGRESS_INTERVAL):
+            progress = min(100, self.done * 100 // self.total) if self.total else 0
+            line = f"Прогресс: {progress}%"
+            last = self.last
+            if last is not None:
+                line += f" | {self.label}: {self.to_text(last)}"
+            print(line, end="\r")
             
-        self.start_button.setEnabled(True)
-        self.stop_button.setEnabled(False)
-        self.results.append("Выполнение завершено")
-
-    def get_charset(self):
-        charset = ""
-        if self.use_lowercase.isChecked():
-            charset += string.ascii_lowercase
-        if self.use_uppercase.isChecked():
-            charset += string.ascii_uppercase
-        if self.use_digits.isChecked():
-            charset += string.digits
-        if self.use_special.isChecked():
-            charset += string.punctuation
-        
-        custom = self.custom_charset.text()
-        if custom:
-            for char in custom:
-                if char not in charset:
-                    charset += char
-        
-        return charset
-
-    def browse_dictionary(self):
-        file_path, _ = QFileDialog.getOpenFileName(self, "Выберите файл словаря", "", "Текстовые файлы (*.txt);;Все файлы (*)")
-        if file_path:
-            self.dict_path.setText(file_path)
-    
-    def browse_rainbow(self):
-        file_path, _ = QFileDialog.getOpenFileName(self, "Выберите файл радужной таблицы", "", "Текстовые файлы (*.txt);;Все файлы (*)")
-        if file_path:
-            self.rainbow_path.setText(file_path)
+    def finish(self):
+        self._finished.set()
+        self.join()
 
 # Функции для режима командной строки
 def bruteforce_cli(args):
+    # Хеш, который не может совпасть с выводом алгоритма, отвергаем до перебора
+    error = validate_target_hash(args.hash, args.type)
+    if error:
+        print(error)
+        sys.exit(1)
+    
     print(f"Начало брутфорса для хеша: {args.hash}")
     print(f"Тип хеша: {args.type}")
+    print(f"Реализация хеширования: {describe_hash_backend(args.type)}")
+    
+    # Границы длины по умолчанию для перебора
+    if args.min_length is None:
+        args.min_length = 1
+    if args.max_length is None:
+        args.max_length = 4
     
     # Определяем набор символов
     if args.charset:
-        charset = args.charset
+        charset = build_charset("", args.charset)
     else:
-        charset = ""
-        if "a" in args.charset_preset:
-            charset += string.ascii_lowercase
-        if "A" in args.charset_preset:
-            charset += string.ascii_uppercase
-        if "0" in args.charset_preset:
-            charset += string.digits
-        if "!" in args.charset_preset:
-            charset += string.punctuation
+        charset = build_charset(args.charset_preset)
+    
+    if not charset:
+        print("Ошибка: выберите хотя бы один набор символов")
+        sys.exit(1)
     
     print(f"Набор символов: {charset}")
     print(f"Длина: {args.min_length}-{args.max_length}")
     print("Выполнение...")
     
-    found = False
-    total_combinations = 0
-    for length in range(args.min_length, args.max_length + 1):
-        total_combinations += len(charset) ** length
-        
-    tried_combinations = 0
-    
-    for length in range(args.min_length, args.max_length + 1):
-        for attempt in itertools.product(charset, repeat=length):
-            tried_combinations += 1
-            if tried_combinations % 10000 == 0:
-                progress = min(100, int((tried_combinations / total_combinations) * 100))
-                print(f"Прогресс: {progress}% | Текущая комбинация: {''.join(attempt)}", end="\r")
+    # Целевой хеш и алгоритм разбираем один раз, кандидаты перебираем пачками в байтах
+    target_hash = args.hash.lower()
+    find_match, uses_bytes = make_batch_matcher(args.type, target_hash)
+    to_text = bytes.decode if uses_bytes else str
+    if uses_bytes:
+        charset = [char.encode() for char in charset]
+    
+    total_combinations = count_combinations(len(charset), args.min_length, args.max_length)
+    
+    # Большие пространства перебора делим между процессами, как и в GUI
+    target_bytes = parse_target_hash(target_hash)
+    workers = os.cpu_count() or 1
+    candidate = None
+    reporter = ProgressReporter(total_combinations, "Текущая комбинация", to_text)
+    reporter.start()
+    try:
+        if (get_hash_template(args.type) is not None and target_bytes is not None
+                and workers > 1 and total_combinations >= PARALLEL_MIN_COMBINATIONS):
+            print(f"Процессов: {workers}")
             
-            text = ''.join(attempt)
-            hashed = get_hash(text, args.type)
+            def report(tried_combinations, last):
+                reporter.done = tried_combinations
+                if last is not None:
+                    reporter.last = last
             
-            if hashed == args.hash.lower():
-                print(f"\nНайдено совпадение!")
-                print(f"Текст: {text}")
-                print(f"Хеш: {hashed}")
-                found = True
-                break
-        
-        if found:
-            break
+            candidate = parallel_bruteforce(args.type, target_bytes, charset, args.min_length,
+                                            args.max_length, workers, report)
+        else:
+            for length in range(args.min_length, args.max_length + 1):
+                for head, tails in iter_candidate_groups(charset, length):
+                    candidate = find_match(head, tails)
+                    if candidate is not None:
+                        break
+                    
+                    reporter.done += len(tails)
+                    reporter.last = head + tails[-1]
+                
+                if candidate is not None:
+                    break
+    finally:
+        reporter.finish()
     
-    if not found:
+    if candidate is not None:
+        print(f"\nНайдено совпадение!")
+        print(f"Текст: {to_text(candidate)}")
+        # hex считаем только для найденной комбинации
+        digest = get_hash_bytes(candidate, args.type)
+        print(f"Хеш: {digest.hex() if digest is not None else target_hash}")
+    else:
         print("\nСовпадений не найдено.")
     
     print("Выполнение завершено")
 
 def dictionary_cli(args):
+    # Хеш, который не может совпасть с выводом алгоритма, отвергаем до перебора
+    error = validate_target_hash(args.hash, args.type)
+    if error:
+        print(error)
+        sys.exit(1)
+    
     print(f"Начало брутфорса по словарю для хеша: {args.hash}")
     print(f"Тип хеша: {args.type}")
+    print(f"Реализация хеширования: {describe_hash_backend(args.type)}")
     print(f"Файл словаря: {args.dict}")
+    # Заданные границы длины отсеивают строки словаря до хеширования
+    if args.min_length is not None or args.max_length is not None:
+        print(f"Длина строк (байт): {args.min_length or 1}-{args.max_length if args.max_length is not None else '∞'}")
     print("Выполнение...")
     
-    # Сначала посчитаем количество строк в файле для прогресса
-    total_lines = 0
-    with open(args.dict, 'r', encoding='utf-8', errors='ignore') as f:
-        for _ in f:
-            total_lines += 1
-            
-    tried_combinations = 0
-    found = False
-    
-    with open(args.dict, 'r', encoding='utf-8', errors='ignore') as f:
-        for line in f:
-            tried_combinations += 1
-            if tried_combinations % 1000 == 0:
-                progress = min(100, int((tried_combinations / total_lines) * 100))
-                print(f"Прогресс: {progress}% | Текущая комбинация: {line.strip()}", end="\r")
+    # Словарь читается через mmap в байтах; прогресс считаем по позиции в файле,
+    # поэтому строки заранее не считаем
+    target_hash = args.hash.lower()
+    find_match = make_line_matcher(args.type, target_hash)
+    total_bytes = os.path.getsize(args.dict)
+    match = None
+    
+    # Большие словари делим на участки по границам строк и проверяем в нескольких процессах
+    target_bytes = parse_target_hash(target_hash)
+    workers = os.cpu_count() or 1
+    reporter = ProgressReporter(total_bytes, "Текущая комбинация",
+                                functools.partial(bytes.decode, encoding='utf-8', errors='ignore'))
+    reporter.start()
+    try:
+        if (get_hash_template(args.type) is not None and target_bytes is not None
+                and workers > 1 and total_bytes >= PARALLEL_MIN_DICTIONARY_SIZE):
+            print(f"Процессов: {workers}")
             
-            text = line.strip()
-            if not text:  # Пропускаем пустые строки
-                continue
-                
-            hashed = get_hash(text, args.type)
+            def report(done_bytes, _):
+                reporter.done = done_bytes
             
-            if hashed == args.hash.lower():
-                print(f"\nНайдено совпадение!")
-                print(f"Текст: {text}")
-                print(f"Хеш: {hashed}")
-                found = True
-                break
+            match = parallel_dictionary_search(args.type, target_bytes, args.dict, workers, report,
+                                               args.min_length, args.max_length)
+        else:
+            with open(args.dict, 'rb') as f, map_file(f) as mm:
+                for batch, position in iter_line_batches(mm, 0, total_bytes,
+                                                         args.min_length, args.max_length):
+                    match = find_match(batch)
+                    if match is not None:
+                        break
+                    
+                    reporter.done = position
+                    reporter.last = batch[-1]
+    finally:
+        reporter.finish()
     
-    if not found:
+    if match is not None:
+        print(f"\nНайдено совпадение!")
+        print(f"Текст: {match.decode('utf-8', 'ignore')}")
+        # hex считаем только для найденной строки
+        digest = get_hash_bytes(match, args.type)
+        print(f"Хеш: {digest.hex() if digest is not None else target_hash}")
+    else:
         print("\nСовпадений не найдено.")
     
     print("Выполнение завершено")
@@ -866,61 +1066,60 @@ def rainbow_cli(args):
     print(f"Файл радужной таблицы: {args.rainbow}")
     print("Выполнение...")
     
-    # Сначала посчитаем количество строк в файле для прогресса
-    total_lines = 0
-    with open(args.rainbow, 'r', encoding='utf-8', errors='ignore') as f:
-        for _ in f:
-            total_lines += 1
-            
-    tried_combinations = 0
-    found = False
-    
-    with open(args.rainbow, 'r', encoding='utf-8', errors='ignore') as f:
-        for line in f:
-            tried_combinations += 1
-            if tried_combinations % 1000 == 0:
-                progress = min(100, int((tried_combinations / total_lines) * 100))
-                print(f"Прогресс: {progress}% | Текущая строка: {line.strip()}", end="\r")
-            
-            line = line.strip()
-            if not line:  # Пропускаем пустые строки
-                continue
-            
-            # Ожидаем формат файла: хеш:текст
-            if ':' not in line:
-                continue
-                
-            stored_hash, plaintext = line.split(':', 1)
-            stored_hash = stored_hash.lower()
-            
-            if stored_hash == args.hash.lower():
-                print(f"\nНайдено совпадение!")
-                print(f"Текст: {plaintext}")
-                print(f"Хеш: {stored_hash}")
-                found = True
-                break
+    target_hash = args.hash.lower()
+    target_bytes = parse_target_hash(target_hash)
+    
+    def report(progress, line):
+        print(f"Прогресс: {progress}% | Текущая строка: {line}", end="\r")
+    
+    # Hex-хеш ищем двоичным поиском по индексу, если он построен для текущей версии таблицы
+    if target_bytes is not None and rainbow_index_is_fresh(args.rainbow):
+        print("Поиск по индексу")
+        plaintext = lookup_rainbow_index(args.rainbow, target_bytes)
+    else:
+        if target_bytes is not None:
+            print(f"Индекс не найден или устарел, таблица просматривается целиком. "
+                  f"Для быстрого поиска постройте индекс: -m index -r {args.rainbow}")
+        plaintext = scan_rainbow_table(args.rainbow, target_hash, report)
     
-    if not found:
+    if plaintext is not None:
+        print(f"\nНайдено совпадение!")
+        print(f"Текст: {plaintext.decode('utf-8', 'ignore')}")
+        print(f"Хеш: {target_bytes.hex() if target_bytes is not None else target_hash}")
+    else:
         print("\nСовпадений не найдено.")
     
     print("Выполнение завершено")
 
+def index_cli(args):
+    print(f"Построение индекса радужной таблицы: {args.rainbow}")
+    
+    def report(progress, line):
+        print(f"Прогресс: {progress}% | Текущая строка: {line}", end="\r")
+    
+    build_rainbow_index(args.rainbow, report)
+    
+    print(f"\nИндекс сохранен: {rainbow_index_path(args.rainbow)}")
+
 def parse_arguments():
     parser = argparse.ArgumentParser(description='Брутфорс хешей с GUI или командной строкой')
     
     # Основные параметры
     parser.add_argument('-t', '--type', help='Тип хеша (MD5, SHA1, SHA256, и т.д.)', default='MD5')
     parser.add_argument('-H', '--hash', help='Целевой хеш для поиска')
-    parser.add_argument('-m', '--mode', choices=['brute', 'dict', 'rainbow', 'gui'], 
-                        help='Режим работы: brute (перебор), dict (словарь), rainbow (радужные таблицы), gui (графический интерфейс)', 
+    parser.add_argument('-m', '--mode', choices=['brute', 'dict', 'rainbow', 'index', 'gui'], 
+                        help='Режим работы: brute (перебор), dict (словарь), rainbow (радужные таблицы), '
+                             'index (индекс радужной таблицы), gui (графический интерфейс)', 
                         default='gui')
     
     # Параметры для режима перебора
     parser.add_argument('-c', '--charset', help='Свой набор символов для перебора')
     parser.add_argument('-p', '--charset-preset', help='Набор символов (a - строчные, A - заглавные, 0 - цифры, ! - спецсимволы)', 
                        default='a0')
-    parser.add_argument('-min', '--min-length', help='Минимальная длина строки', type=int, default=1)
-    parser.add_argument('-max', '--max-length', help='Максимальная длина строки', type=int, default=4)
+    parser.add_argument('-min', '--min-length', type=int,
+                        help='Минимальная длина строки (по умолчанию 1; в режиме словаря - фильтр длины в байтах)')
+    parser.add_argument('-max', '--max-length', type=int,
+                        help='Максимальная длина строки (по умолчанию 4; в режиме словаря - фильтр длины в байтах)')
     
     # Параметры для режима словаря
     parser.add_argument('-d', '--dict', help='Путь к файлу словаря для атаки по словарю')
@@ -931,11 +1130,21 @@ def parse_arguments():
     # Параметры для пользовательского хеша
     parser.add_argument('--custom-hash', help='Путь к файлу с пользовательской функцией хеширования')
     
+    # JIT-компиляция доступна только при запуске под PyPy
+    parser.add_argument('--jit', action='store_true',
+                        help='Ожидать JIT-компиляцию циклов перебора (требуется запуск через pypy3)')
+    
     return parser.parse_args()
 
 def main():
     args = parse_arguments()
     
+    # Сам флаг ничего не включает: трассирующий JIT есть только у PyPy
+    if args.jit and platform.python_implementation() != 'PyPy':
+        print(f"Предупреждение: --jit действует только под PyPy, текущий интерпретатор - "
+              f"{platform.python_implementation()} {platform.python_version()}")
+        print(f"Запустите: pypy3 {' '.join(sys.argv)}")
+    
     # Если указан файл с пользовательской хеш-функцией, загружаем его
     if args.custom_hash and os.path.isfile(args.custom_hash):
         try:
@@ -954,10 +1163,24 @@ def main():
     
     # Проверяем режим запуска
     if args.mode == 'gui':
+        # PyQt5 и окно импортируются только здесь, чтобы режимы командной строки
+        # работали без PyQt5 (например, под PyPy). Скрипт регистрируется под именем
+        # модуля, чтобы интерфейс использовал те же глобальные переменные, а не
+        # вторую копию модуля
+        sys.modules.setdefault('hash_bruteforcer', sys.modules[__name__])
+        from PyQt5.QtWidgets import QApplication
+        from hash_bruteforcer_gui import HashBruteForcer
+        
         app = QApplication(sys.argv)
         window = HashBruteForcer()
         window.show()
         sys.exit(app.exec_())
+    elif args.mode == 'index':
+        # Индекс строится по таблице целиком, целевой хеш не нужен
+        if not args.rainbow:
+            print("Ошибка: для построения индекса необходимо указать файл таблицы с помощью параметра --rainbow")
+            sys.exit(1)
+        index_cli(args)
     else:
         # Режим командной строки
         if not args.hash:
@@ -0,0 +1,714 @@
+#!/usr/bin/env python3
+# Графический интерфейс и потоки поиска на PyQt5. Модуль импортируется только
+# в режиме GUI, поэтому режимы командной строки работают и без PyQt5
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from PyQt5.QtWidgets import (QMainWindow, QLabel, QComboBox, 
+                            QLineEdit, QPushButton, QTextEdit, QProgressBar, 
+                            QSpinBox, QCheckBox, QGridLayout, QWidget, QGroupBox,
+                            QTabWidget, QFileDialog, QHBoxLayout, QVBoxLayout,
+                            QMessageBox)
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from hash_bruteforcer import (PROGRESS_INTERVAL, THREAD_HASH_MIN_LENGTH, PARALLEL_MIN_COMBINATIONS,
+                              get_available_hash_algorithms, get_hash, get_hash_template, build_charset,
+                              count_combinations, parse_target_hash, validate_target_hash,
+                              iter_candidate_groups, map_file, iter_line_batches,
+                              rainbow_index_is_fresh, build_rainbow_index, lookup_rainbow_index,
+                              parallel_bruteforce, make_batch_matcher, make_line_matcher,
+                              scan_rainbow_table, load_custom_hash_function)
+
+
+class BruteForceWorker(QThread):
+    update_progress = pyqtSignal(int, str)
+    found_match = pyqtSignal(str, str)
+    finished_task = pyqtSignal()
+    
+    def __init__(self, hash_type, target_hash, char_set, min_length, max_length):
+        super().__init__()
+        self.hash_type = hash_type
+        self.target_hash = target_hash.lower()
+        self.char_set = char_set
+        self.min_length = min_length
+        self.max_length = max_length
+        self.running = True
+        
+        # Алгоритм и целевой хеш разбираем один раз, а не на каждой комбинации
+        self._template = get_hash_template(hash_type)
+        self._target_bytes = parse_target_hash(self.target_hash)
+        
+        # Символы кодируем заранее: комбинации собираются сразу в байтах,
+        # без промежуточных строк и вызова encode() на каждую комбинацию
+        self._charset_bytes = [char.encode() for char in char_set]
+        
+    def stop(self):
+        self.running = False
+        
+    def run(self):
+        total_combinations = count_combinations(len(self.char_set), self.min_length, self.max_length)
+        
+        # Большие пространства перебора делим между процессами. Пользовательская
+        # функция не передается в другие процессы, поэтому CUSTOM всегда
+        # перебирается в текущем потоке
+        workers = os.cpu_count() or 1
+        if (self._template is not None and self._target_bytes is not None
+                and workers > 1 and total_combinations >= PARALLEL_MIN_COMBINATIONS):
+            found = self.run_parallel(total_combinations, workers)
+        else:
+            found = self.run_sequential(total_combinations)
+        
+        # Устанавливаем прогресс в 100% при завершении, если не был найден результат
+        if not found and self.running:
+            self.update_progress.emit(100, "")
+                
+        self.finished_task.emit()
+    
+    def run_sequential(self, total_combinations):
+        tried_combinations = 0
+        found = False
+        next_emit = time.monotonic() + PROGRESS_INTERVAL
+        
+        find_match, uses_bytes = make_batch_matcher(self.hash_type, self.target_hash)
+        charset = self._charset_bytes if uses_bytes else self.char_set
+        to_text = bytes.decode if uses_bytes else str
+        
+        for length in range(self.min_length, self.max_length + 1):
+            if not self.running:
+                break
+            
+            for head, tails in iter_candidate_groups(charset, length):
+                if not self.running:
+                    break
+                
+                candidate = find_match(head, tails)
+                if candidate is not None:
+                    found = True
+                    text = to_text(candidate)
+                    self.found_match.emit(text, self.target_hash)
+                    # Обеспечиваем достижение 100% прогресса при нахождении совпадения
+                    self.update_progress.emit(100, text)
+                    break
+                
+                tried_combinations += len(tails)
+                now = time.monotonic()
+                if now >= next_emit:
+                    progress = min(100, tried_combinations * 100 // total_combinations)
+                    self.update_progress.emit(progress, to_text(head + tails[-1]))
+                    next_emit = now + PROGRESS_INTERVAL
+            
+            if found:
+                break
+        
+        return found
+    
+    def run_parallel(self, total_combinations, workers):
+        def report(tried_combinations, last):
+            if last is not None:
+                progress = min(100, tried_combinations * 100 // total_combinations)
+                self.update_progress.emit(progress, last.decode())
+            return self.running
+        
+        found = parallel_bruteforce(self.hash_type, self._target_bytes, self._charset_bytes,
+                                    self.min_length, self.max_length, workers, report)
+        if found is None:
+            return False
+        
+        text = found.decode()
+        self.found_match.emit(text, self._target_bytes.hex())
+        # Обеспечиваем достижение 100% прогресса при нахождении совпадения
+        self.update_progress.emit(100, text)
+        return True
+    
+    def get_hash(self, text):
+        return get_hash(text, self.hash_type)
+
+class DictionaryBruteForceWorker(QThread):
+    update_progress = pyqtSignal(int, str)
+    found_match = pyqtSignal(str, str)
+    finished_task = pyqtSignal()
+    
+    def __init__(self, hash_type, target_hash, dictionary_path):
+        super().__init__()
+        self.hash_type = hash_type
+        self.target_hash = target_hash.lower()
+        self.dictionary_path = dictionary_path
+        self.running = True
+        
+        self._template = get_hash_template(hash_type)
+        self._target_bytes = parse_target_hash(self.target_hash)
+        
+    def stop(self):
+        self.running = False
+        
+    def run(self):
+        found = False
+        next_emit = time.monotonic() + PROGRESS_INTERVAL
+        
+        new_hash = self._template.copy if self._template is not None else None
+        tgt = self._target_bytes
+        find_match = make_line_matcher(self.hash_type, self.target_hash)
+        workers = os.cpu_count() or 1
+        pool = None
+        
+        def hash_line(text):
+            h = new_hash()
+            h.update(text)
+            return h.digest()
+        
+        # Прогресс считаем по позиции в файле, поэтому строки заранее не считаем
+        total_bytes = os.path.getsize(self.dictionary_path)
+        
+        with open(self.dictionary_path, 'rb') as f, map_file(f) as mm:
+            # Строки хешируются как есть, в байтах; декодируем только для вывода
+            try:
+                for batch, position in iter_line_batches(mm, 0, total_bytes):
+                    if not self.running:
+                        break
+                    
+                    if (new_hash is not None and workers > 1
+                            and sum(map(len, batch)) >= len(batch) * THREAD_HASH_MIN_LENGTH):
+                        # hashlib отпускает GIL только на длинных данных, поэтому
+                        # потоки ускоряют лишь словари с длинными строками
+                        if pool is None:
+                            pool = ThreadPoolExecutor(max_workers=workers)
+                        digests = list(pool.map(hash_line, batch))
+                        match = batch[digests.index(tgt)] if tgt in digests else None
+                    else:
+                        match = find_match(batch)
+                    
+                    if match is not None:
+                        text = match.decode('utf-8', 'ignore')
+                        self.found_match.emit(text, self.target_hash)
+                        # Обеспечиваем достижение 100% прогресса при нахождении совпадения
+                        self.update_progress.emit(100, text)
+                        found = True
+                        break
+                    
+                    # Сигнал отправляем не чаще, чем раз в PROGRESS_INTERVAL секунд
+                    now = time.monotonic()
+                    if now >= next_emit:
+                        progress = min(100, position * 100 // total_bytes)
+                        self.update_progress.emit(progress, batch[-1].decode('utf-8', 'ignore'))
+                        next_emit = now + PROGRESS_INTERVAL
+            finally:
+                if pool is not None:
+                    pool.shutdown()
+        
+        # Устанавливаем прогресс в 100% при завершении, если не был найден результат
+        if not found and self.running:
+            self.update_progress.emit(100, "")
+                    
+        self.finished_task.emit()
+    
+    def get_hash(self, text):
+        return get_hash(text, self.hash_type)
+
+class RainbowTableWorker(QThread):
+    update_progress = pyqtSignal(int, str)
+    found_match = pyqtSignal(str, str)
+    finished_task = pyqtSignal()
+    
+    def __init__(self, target_hash, rainbow_path):
+        super().__init__()
+        self.target_hash = target_hash.lower()
+        self.rainbow_path = rainbow_path
+        self.running = True
+        
+        # Если целевой хеш не hex (например, от CUSTOM), сравниваем строки
+        self._target_bytes = parse_target_hash(self.target_hash)
+        
+    def stop(self):
+        self.running = False
+        
+    def run(self):
+        found = None
+        
+        # Hex-хеш ищем по отсортированному индексу, остальные - просмотром всей таблицы
+        if self._target_bytes is not None:
+            found = self.search_index()
+        if found is None:
+            found = self.scan_table()
+        
+        # Устанавливаем прогресс в 100% при завершении, если не был найден результат
+        if not found and self.running:
+            self.update_progress.emit(100, "")
+                    
+        self.finished_task.emit()
+        
+    def report_progress(self, progress, line):
+        self.update_progress.emit(progress, line)
+        return self.running
+        
+    # Возвращает True/False по результату поиска или None, если индекс недоступен
+    def search_index(self):
+        try:
+            if not rainbow_index_is_fresh(self.rainbow_path):
+                if not build_rainbow_index(self.rainbow_path, self.report_progress):
+                    return False
+            plaintext = lookup_rainbow_index(self.rainbow_path, self._target_bytes)
+        except OSError:
+            # Индекс не удалось записать или прочитать (например, каталог только для чтения)
+            return None
+        
+        if plaintext is None:
+            return False
+        
+        plaintext = plaintext.decode('utf-8', 'ignore')
+        self.found_match.emit(plaintext, self._target_bytes.hex())
+        # Обеспечиваем достижение 100% прогресса при нахождении совпадения
+        self.update_progress.emit(100, plaintext)
+        return True
+        
+    def scan_table(self):
+        plaintext = scan_rainbow_table(self.rainbow_path, self.target_hash, self.report_progress)
+        if plaintext is None:
+            return False
+        
+        if self._target_bytes is not None:
+            stored_hash = self._target_bytes.hex()
+        else:
+            stored_hash = self.target_hash
+        
+        plaintext = plaintext.decode('utf-8', 'ignore')
+        self.found_match.emit(plaintext, stored_hash)
+        # Обеспечиваем достижение 100% прогресса при нахождении совпадения
+        self.update_progress.emit(100, plaintext)
+        return True
+
+class HashBruteForcer(QMainWindow):
+    def __init__(self):
+        super().__init__()
+        self.initUI()
+        self.worker = None
+        
+    def initUI(self):
+        self.setWindowTitle('Хеш Брутфорсер')
+        self.resize(700, 600)
+        
+        # Main widget and layout
+        main_widget = QWidget()
+        self.setCentralWidget(main_widget)
+        grid = QGridLayout(main_widget)
+        
+        # Создаем вкладки
+        self.tabs = QTabWidget()
+        
+        # Вкладка для брутфорса перебором
+        self.bruteforce_tab = QWidget()
+        self.setup_bruteforce_tab()
+        self.tabs.addTab(self.bruteforce_tab, "Перебор")
+        
+        # Вкладка для брутфорса по словарю
+        self.dictionary_tab = QWidget()
+        self.setup_dictionary_tab()
+        self.tabs.addTab(self.dictionary_tab, "Словарь")
+        
+        # Вкладка для радужных таблиц
+        self.rainbow_tab = QWidget()
+        self.setup_rainbow_tab()
+        self.tabs.addTab(self.rainbow_tab, "Радужные таблицы")
+        
+        # Вкладка для своего метода хеширования
+        self.custom_hash_tab = QWidget()
+        self.setup_custom_hash_tab()
+        self.tabs.addTab(self.custom_hash_tab, "Свой хеш")
+        
+        # Hash settings group (общий для всех вкладок)
+        hash_group = QGroupBox("Настройки хеша")
+        hash_layout = QGridLayout()
+        hash_group.setLayout(hash_layout)
+        
+        # Hash type
+        hash_layout.addWidget(QLabel("Тип хеша:"), 0, 0)
+        self.hash_type = QComboBox()
+        # Получаем все доступные алгоритмы хеширования
+        self.hash_type.addItems(get_available_hash_algorithms())
+        hash_layout.addWidget(self.hash_type, 0, 1)
+        
+        # Target hash
+        hash_layout.addWidget(QLabel("Целевой хеш:"), 1, 0)
+        self.target_hash = QLineEdit()
+        hash_layout.addWidget(self.target_hash, 1, 1)
+        
+        # Control buttons
+        control_group = QGroupBox("Управление")
+        control_layout = QGridLayout()
+        control_group.setLayout(control_layout)
+        
+        self.start_button = QPushButton("Начать")
+        self.start_button.clicked.connect(self.start_bruteforce)
+        control_layout.addWidget(self.start_button, 0, 0)
+        
+        self.stop_button = QPushButton("Остановить")
+        self.stop_button.clicked.connect(self.stop_bruteforce)
+        self.stop_button.setEnabled(False)
+        control_layout.addWidget(self.stop_button, 0, 1)
+        
+        # Progress
+        progress_group = QGroupBox("Прогресс")
+        progress_layout = QGridLayout()
+        progress_group.setLayout(progress_layout)
+        
+        self.progress_bar = QProgressBar()
+        progress_layout.addWidget(self.progress_bar, 0, 0, 1, 2)
+        
+        progress_layout.addWidget(QLabel("Текущая комбинация:"), 1, 0)
+        self.current_attempt = QLineEdit()
+        self.current_attempt.setReadOnly(True)
+        progress_layout.addWidget(self.current_attempt, 1, 1)
+        
+        # Results
+        results_group = QGroupBox("Результаты")
+        results_layout = QGridLayout()
+        results_group.setLayout(results_layout)
+        
+        self.results = QTextEdit()
+        self.results.setReadOnly(True)
+        results_layout.addWidget(self.results, 0, 0)
+        
+        # Add all groups to main layout
+        grid.addWidget(self.tabs, 0, 0, 1, 2)
+        grid.addWidget(hash_group, 1, 0, 1, 2)
+        grid.addWidget(control_group, 2, 0, 1, 2)
+        grid.addWidget(progress_group, 3, 0, 1, 2)
+        grid.addWidget(results_group, 4, 0, 1, 2)
+    
+    def setup_bruteforce_tab(self):
+        layout = QGridLayout(self.bruteforce_tab)
+        
+        # Character set group
+        charset_group = QGroupBox("Набор символов")
+        charset_layout = QGridLayout()
+        charset_group.setLayout(charset_layout)
+        
+        # Character set options
+        self.use_lowercase = QCheckBox("Строчные буквы (a-z)")
+        self.use_lowercase.setChecked(True)
+        charset_layout.addWidget(self.use_lowercase, 0, 0)
+        
+        self.use_uppercase = QCheckBox("Заглавные буквы (A-Z)")
+        charset_layout.addWidget(self.use_uppercase, 1, 0)
+        
+        self.use_digits = QCheckBox("Цифры (0-9)")
+        self.use_digits.setChecked(True)
+        charset_layout.addWidget(self.use_digits, 2, 0)
+        
+        self.use_special = QCheckBox("Специальные символы")
+        charset_layout.addWidget(self.use_special, 3, 0)
+        
+        self.custom_charset = QLineEdit()
+        self.custom_charset.setPlaceholderText("Свой набор символов (опционально)")
+        charset_layout.addWidget(self.custom_charset, 4, 0, 1, 2)
+        
+        # Length settings
+        length_group = QGroupBox("Длина строки")
+        length_layout = QGridLayout()
+        length_group.setLayout(length_layout)
+        
+        length_layout.addWidget(QLabel("Минимальная длина:"), 0, 0)
+        self.min_length = QSpinBox()
+        self.min_length.setMinimum(1)
+        self.min_length.setMaximum(10)
+        self.min_length.setValue(1)
+        length_layout.addWidget(self.min_length, 0, 1)
+        
+        length_layout.addWidget(QLabel("Максимальная длина:"), 1, 0)
+        self.max_length = QSpinBox()
+        self.max_length.setMinimum(1)
+        self.max_length.setMaximum(10)
+        self.max_length.setValue(4)
+        length_layout.addWidget(self.max_length, 1, 1)
+        
+        layout.addWidget(charset_group, 0, 0)
+        layout.addWidget(length_group, 1, 0)
+        
+    def setup_dictionary_tab(self):
+        layout = QGridLayout(self.dictionary_tab)
+        
+        # Dictionary file selection
+        dict_group = QGroupBox("Файл словаря")
+        dict_layout = QGridLayout()
+        dict_group.setLayout(dict_layout)
+        
+        dict_layout.addWidget(QLabel("Путь к файлу:"), 0, 0)
+        
+        # File selection layout
+        file_layout = QHBoxLayout()
+        
+        self.dict_path = QLineEdit()
+        self.dict_path.setReadOnly(True)
+        self.dict_path.setPlaceholderText("Выберите файл словаря...")
+        file_layout.addWidget(self.dict_path)
+        
+        self.browse_button = QPushButton("Обзор...")
+        self.browse_button.clicked.connect(self.browse_dictionary)
+        file_layout.addWidget(self.browse_button)
+        
+        dict_layout.addLayout(file_layout, 0, 1)
+        
+        # Dictionary options
+        self.dict_options_group = QGroupBox("Настройки словаря")
+        dict_options_layout = QGridLayout()
+        self.dict_options_group.setLayout(dict_options_layout)
+        
+        self.use_dict_as_is = QCheckBox("Использовать слова как есть")
+        self.use_dict_as_is.setChecked(True)
+        dict_options_layout.addWidget(self.use_dict_as_is, 0, 0)
+        
+        # В будущем можно добавить дополнительные опции:
+        # - Добавление чисел до/после слова
+        # - Использование разных регистров
+        # - Замена букв на похожие символы
+        
+        layout.addWidget(dict_group, 0, 0)
+        layout.addWidget(self.dict_options_group, 1, 0)
+    
+    def setup_rainbow_tab(self):
+        layout = QGridLayout(self.rainbow_tab)
+        
+        # Rainbow table file selection
+        rainbow_group = QGroupBox("Файл радужной таблицы")
+        rainbow_layout = QGridLayout()
+        rainbow_group.setLayout(rainbow_layout)
+        
+        rainbow_layout.addWidget(QLabel("Путь к файлу:"), 0, 0)
+        
+        # File selection layout
+        file_layout = QHBoxLayout()
+        
+        self.rainbow_path = QLineEdit()
+        self.rainbow_path.setReadOnly(True)
+        self.rainbow_path.setPlaceholderText("Выберите файл радужной таблицы...")
+        file_layout.addWidget(self.rainbow_path)
+        
+        self.rainbow_browse_button = QPushButton("Обзор...")
+        self.rainbow_browse_button.clicked.connect(self.browse_rainbow)
+        file_layout.addWidget(self.rainbow_browse_button)
+        
+        rainbow_layout.addLayout(file_layout, 0, 1)
+        
+        # Информация о радужных таблицах
+        info_group = QGroupBox("Информация")
+        info_layout = QVBoxLayout()
+        info_group.setLayout(info_layout)
+        
+        info_text = QTextEdit()
+        info_text.setReadOnly(True)
+        info_text.setPlainText(
+            "Радужные таблицы - это метод взлома хешей, который использует предварительно вычисленные таблицы для нахождения "
+            "исходного текста по его хешу.\n\n"
+            "Формат файла радужной таблицы: хеш:исходный_текст (по одной паре на строку).\n\n"
+            "Пример:\n"
+            "5f4dcc3b5aa765d61d8327deb882cf99:password\n"
+            "827ccb0eea8a706c4c34a16891f84e7b:12345"
+        )
+        info_layout.addWidget(info_text)
+        
+        layout.addWidget(rainbow_group, 0, 0)
+        layout.addWidget(info_group, 1, 0)
+    
+    def setup_custom_hash_tab(self):
+        layout = QVBoxLayout(self.custom_hash_tab)
+        
+        # Группа для редактора кода хеш-функции
+        editor_group = QGroupBox("Редактор кода хеш-функции")
+        editor_layout = QVBoxLayout()
+        editor_group.setLayout(editor_layout)
+        
+        # Описание и инструкции
+        instructions = QLabel(
+            "Введите код для вашей хеш-функции. Функция должна принимать строку и возвращать хеш.\n"
+            "Код должен быть отступлен на 4 пробела, так как он будет вставлен в тело функции.\n"
+            "Можно также объявить def custom_hash(data) без отступа: тогда функция получает байты,\n"
+            "а необязательная custom_hash_batch(items) хеширует сразу список строк в байтах.\n"
+            "Если установлен Numba, числовой код (ord, арифметика, циклы) компилируется автоматически;\n"
+            "компиляция при загрузке может занять несколько секунд."
+        )
+        editor_layout.addWidget(instructions)
+        
+        # Пример кода
+        example_code = QTextEdit()
+        example_code.setReadOnly(True)
+        example_code.setPlainText(
+            "# Пример своей хеш-функции:\n\n"
+            "    # Простой хеш-алгоритм, суммирующий ASCII-коды символов\n"
+            "    total = 0\n"
+            "    for char in text:\n"
+            "        total += ord(char)\n"
+            "    return hex(total)[2:]  # Преобразуем в hex и убираем '0x'\n\n"
+            "# Для использования встроенных алгоритмов можно импортировать hashlib:\n\n"
+            "    import hashlib\n"
+            "    # Комбинированный хеш MD5 + SHA1\n"
+            "    md5 = hashlib.md5(text.encode()).hexdigest()\n"
+            "    sha1 = hashlib.sha1(text.encode()).hexdigest()\n"
+            "    return md5 + sha1[:10]  # MD5 + первые 10 символов SHA1"
+        )
+        editor_layout.addWidget(example_code)
+        
+        # Редактор кода
+        editor_layout.addWidget(QLabel("Ваш код хеш-функции:"))
+        self.hash_code_editor = QTextEdit()
+        self.hash_code_editor.setPlainText("    # Введите код вашей хеш-функции здесь\n    return hashlib.md5(text.encode()).hexdigest()")
+        editor_layout.addWidget(self.hash_code_editor)
+        
+        # Кнопка для загрузки функции
+        load_button = QPushButton("Загрузить хеш-функцию")
+        load_button.clicked.connect(self.load_custom_hash)
+        editor_layout.addWidget(load_button)
+        
+        # Статус загрузки
+        self.hash_status = QLabel("Статус: Не загружено")
+        editor_layout.addWidget(self.hash_status)
+        
+        layout.addWidget(editor_group)
+    
+    def load_custom_hash(self):
+        code = self.hash_code_editor.toPlainText()
+        success, message = load_custom_hash_function(code)
+        
+        if success:
+            self.hash_status.setText(f"Статус: {message}")
+            # Обновляем список алгоритмов хеширования
+            current_algo = self.hash_type.currentText()
+            self.hash_type.clear()
+            self.hash_type.addItems(get_available_hash_algorithms())
+            
+            # Попытаемся выбрать "CUSTOM" в списке
+            custom_index = self.hash_type.findText("CUSTOM")
+            if custom_index >= 0:
+                self.hash_type.setCurrentIndex(custom_index)
+            else:
+                # Если не нашли, пытаемся вернуть предыдущий выбор
+                prev_index = self.hash_type.findText(current_algo)
+                if prev_index >= 0:
+                    self.hash_type.setCurrentIndex(prev_index)
+        else:
+            self.hash_status.setText(f"Статус: Ошибка загрузки")
+            # Показываем сообщение об ошибке
+            QMessageBox.critical(self, "Ошибка загрузки хеш-функции", message)
+    
+    def start_bruteforce(self):
+        target_hash = self.target_hash.text().strip()
+        if not target_hash:
+            self.results.append("Ошибка: введите целевой хеш")
+            return
+        
+        hash_type = self.hash_type.currentText()
+        
+        # Для перебора и словаря заранее отсекаем хеш, который алгоритм выдать не может.
+        # Поиск по радужной таблице от типа хеша не зависит
+        if self.tabs.currentIndex() in (0, 1):
+            error = validate_target_hash(target_hash, hash_type)
+            if error:
+                self.results.append(error)
+                return
+        
+        # Очистка прогресса и результатов
+        self.progress_bar.setValue(0)
+        self.current_attempt.clear()
+        self.results.clear()
+        self.results.append(f"Начало брутфорса для хеша: {target_hash}")
+        self.results.append(f"Тип хеша: {hash_type}")
+        
+        # Проверим какая вкладка активна
+        current_tab = self.tabs.currentIndex()
+        
+        if current_tab == 0:  # Вкладка "Перебор"
+            charset = self.get_charset()
+            if not charset:
+                self.results.append("Ошибка: выберите хотя бы один набор символов")
+                return
+                
+            min_length = self.min_length.value()
+            max_length = self.max_length.value()
+            
+            if min_length > max_length:
+                self.results.append("Ошибка: минимальная длина не может быть больше максимальной")
+                return
+                
+            self.results.append(f"Набор символов: {charset}")
+            self.results.append(f"Длина: {min_length}-{max_length}")
+            self.results.append("Выполнение...")
+            
+            self.worker = BruteForceWorker(hash_type, target_hash, charset, min_length, max_length)
+        
+        elif current_tab == 1:  # Вкладка "Словарь"
+            dict_path = self.dict_path.text()
+            if not dict_path or not os.path.isfile(dict_path):
+                self.results.append("Ошибка: выберите корректный файл словаря")
+                return
+            
+            self.results.append(f"Файл словаря: {dict_path}")
+            self.results.append("Выполнение...")
+            
+            self.worker = DictionaryBruteForceWorker(hash_type, target_hash, dict_path)
+            
+        elif current_tab == 2:  # Вкладка "Радужные таблицы"
+            rainbow_path = self.rainbow_path.text()
+            if not rainbow_path or not os.path.isfile(rainbow_path):
+                self.results.append("Ошибка: выберите корректный файл радужной таблицы")
+                return
+            
+            self.results.append(f"Файл радужной таблицы: {rainbow_path}")
+            self.results.append(f"Примечание: для радужных таблиц тип хеша должен соответствовать типу в таблице")
+            self.results.append("Выполнение...")
+            
+            self.worker = RainbowTableWorker(target_hash, rainbow_path)
+            
+        elif current_tab == 3:  # Вкладка "Свой хеш"
+            self.results.append("Ошибка: вкладка 'Свой хеш' используется только для создания хеш-функции")
+            self.results.append("Для выполнения брутфорса перейдите на вкладку 'Перебор', 'Словарь' или 'Радужные таблицы'")
+            return
+        else:
+            self.results.append("Ошибка: неизвестная вкладка")
+            return
+            
+        # Подключаем сигналы и запускаем
+        self.worker.update_progress.connect(self.update_progress)
+        self.worker.found_match.connect(self.found_match)
+        self.worker.finished_task.connect(self.finished_task)
+        
+        self.start_button.setEnabled(False)
+        self.stop_button.setEnabled(True)
+        
+        self.worker.start()
+        
+    def stop_bruteforce(self):
+        if self.worker:
+            self.worker.stop()
+            self.results.append("Остановлено пользователем")
+            
+    def update_progress(self, value, current_text):
+        self.progress_bar.setValue(value)
+        self.current_attempt.setText(current_text)
+        
+    def found_match(self, text, hashed):
+        self.results.append(f"Найдено совпадение!")
+        self.results.append(f"Текст: {text}")
+        self.results.append(f"Хеш: {hashed}")
+        
+    def finished_task(self):
+        # При завершении задачи убедимся, что прогресс-бар установлен на 100%
+        if self.progress_bar.value() < 100:
+            self.progress_bar.setValue(100)
+            
+        self.start_button.setEnabled(True)
+        self.stop_button.setEnabled(False)
+        self.results.append("Выполнение завершено")
+
+    def get_charset(self):
+        checkboxes = (("a", self.use_lowercase), ("A", self.use_uppercase),
+                      ("0", self.use_digits), ("!", self.use_special))
+        presets = ''.join(flag for flag, checkbox in checkboxes if checkbox.isChecked())
+        return build_charset(presets, self.custom_charset.text())
+
+    def browse_dictionary(self):
+        file_path, _ = QFileDialog.getOpenFileName(self, "Выберите файл словаря", "", "Текстовые файлы (*.txt);;Все файлы (*)")
+        if file_path:
+            self.dict_path.setText(file_path)
+    
+    def browse_rainbow(self):
+        file_path, _ = QFileDialog.getOpenFileName(self, "Выберите файл радужной таблицы", "", "Текстовые файлы (*.txt);;Все файлы (*)")
+        if file_path:
+            self.rainbow_path.setText(file_path)